@@ -5,7 +5,7 @@ Protocol-enforced REST API. No hierarchy language.
 Network, not MLM. Bonds, not downlines.
 """
 
-from flask import Blueprint, request, jsonify, g
+from flask import Blueprint, Response, request, jsonify, g
 from functools import wraps
 
 # ─── Blueprints ───────────────────────────────────────────────────────
@@ -294,23 +294,28 @@ def send_tokens():
 @wallet_bp.route("/history/<helios_id>", methods=["GET"])
 @handle_errors
 def get_wallet_history(helios_id):
-    """Get wallet transaction history."""
+    """Get wallet transaction history. Paginate with ?cursor=<next_cursor>."""
     from core.wallet import HeliosWallet
 
     limit = request.args.get("limit", 50, type=int)
     wallet = HeliosWallet(get_db())
-    result = wallet.get_history(helios_id, limit=limit)
+    result = wallet.get_history(
+        helios_id,
+        cursor=request.args.get("cursor"),
+        limit=limit
+    )
     return api_response(result)
 
 
 @wallet_bp.route("/receive-qr/<helios_id>", methods=["GET"])
 @handle_errors
 def get_receive_qr(helios_id):
-    """Get QR code for receiving payments."""
+    """Get QR code for receiving payments. ?format=svg returns inline SVG."""
     from core.wallet import HeliosWallet
 
+    fmt = request.args.get("format", "png")
     wallet = HeliosWallet(get_db())
-    result = wallet.get_receive_qr(helios_id)
+    result = wallet.get_receive_qr(helios_id, fmt=fmt)
     return api_response(result)
 
 
@@ -416,18 +421,24 @@ voice_bp = Blueprint("voice", __name__, url_prefix="/api/voice")
 @voice_bp.route("/speak", methods=["POST"])
 @handle_errors
 def speak_text():
-    """Convert text to speech using ElevenLabs."""
+    """
+    Convert text to speech using ElevenLabs.
+    ?raw=1 returns the MP3 itself (audio/mpeg) instead of base64 JSON.
+    """
     from core.voice import HeliosVoice
 
     data = request.get_json()
     text = data.get("text", "").strip()
     voice_id = data.get("voice_id")  # Optional override
+    raw = request.args.get("raw") == "1"
 
     if not text:
         return api_response(error="No text provided", status=400)
 
     voice = HeliosVoice()
-    result = voice.speak(text, voice_id=voice_id)
+    result = voice.speak(text, voice_id=voice_id, return_bytes=raw)
+    if raw and result.get("audio"):
+        return Response(result["audio"], mimetype="audio/mpeg")
     return api_response(result)
 
 
@@ -646,13 +657,19 @@ def get_receipt(mvr_id):
 @treasury_bp.route("/receipts", methods=["GET"])
 @handle_errors
 def list_receipts():
-    """List vault receipts with optional filters."""
+    """List vault receipts with optional filters. Paginate with ?cursor=<next_cursor>."""
     from core.treasury import TreasuryEngine
 
     metal = request.args.get("metal")
     custody = request.args.get("custody")
+    limit = request.args.get("limit", 50, type=int)
     engine = TreasuryEngine(get_db())
-    result = engine.list_vault_receipts(metal=metal, custody_status=custody)
+    result = engine.list_vault_receipts(
+        metal=metal,
+        custody_status=custody,
+        cursor=request.args.get("cursor"),
+        limit=limit
+    )
     return api_response(result)
 
 
@@ -895,11 +912,15 @@ def create_space():
 @spaces_bp.route("/list", methods=["GET"])
 @handle_errors
 def list_spaces():
-    """List active spaces."""
+    """List active spaces. Paginate with ?cursor=<next_cursor>."""
     from core.spaces import SpaceEngine
 
+    limit = request.args.get("limit", 50, type=int)
     engine = SpaceEngine(get_db())
-    result = engine.list_spaces()
+    result = engine.list_spaces(
+        cursor=request.args.get("cursor"),
+        limit=limit
+    )
     return api_response(result)
 
 
@@ -939,12 +960,17 @@ def create_event():
 @spaces_bp.route("/events", methods=["GET"])
 @handle_errors
 def list_events():
-    """List events with optional space filter."""
+    """List events with optional space filter. Paginate with ?cursor=<next_cursor>."""
     from core.spaces import SpaceEngine
 
     space_id = request.args.get("space_id")
+    limit = request.args.get("limit", 50, type=int)
     engine = SpaceEngine(get_db())
-    result = engine.list_events(space_id=space_id)
+    result = engine.list_events(
+        space_id=space_id,
+        cursor=request.args.get("cursor"),
+        limit=limit
+    )
     return api_response(result)
 
 
@@ -12,6 +12,8 @@ import time
 import logging
 from datetime import datetime, timezone
 from flask import Flask, render_template, request, g, jsonify
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 
@@ -23,11 +25,45 @@ HeliosConfig.validate()
 
 log = logging.getLogger('helios')
 
+try:
+    import orjson
+except ImportError:  # Optional accelerator — the stdlib provider is used instead
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes with orjson. Output matches the
+    default provider: sorted keys, HTTP-date datetimes, Decimal/UUID as
+    str. Pretty-printing and anything orjson rejects (ints past 64 bits)
+    go through the stdlib encoder.
+    """
+
+    _OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                if orjson is not None else 0)
+
+    def dumps(self, obj, **kwargs):
+        if kwargs.keys() <= {"separators"}:
+            option = self._OPTIONS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            try:
+                return orjson.dumps(obj, default=self.default, option=option).decode()
+            except orjson.JSONEncodeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
 
 def create_app():
     """Application factory."""
     app = Flask(__name__)
     app.config.from_object(HeliosConfig)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+
+    # Templates compile once per source checksum, not once per process
+    os.makedirs(HeliosConfig.JINJA_CACHE_DIR, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(HeliosConfig.JINJA_CACHE_DIR)
 
     @app.context_processor
     def inject_build_id():
@@ -106,14 +142,30 @@ def create_app():
     data_dir = os.path.join(os.path.dirname(__file__), "data")
     os.makedirs(data_dir, exist_ok=True)
 
+    engine_options = {}
+    if orjson is not None:
+        # JSON columns are encoded/decoded in C rather than by the stdlib
+        engine_options.update(
+            json_serializer=lambda value: orjson.dumps(value).decode(),
+            json_deserializer=orjson.loads,
+        )
     engine = create_engine(
         HeliosConfig.DATABASE_URL,
         echo=False,
-        pool_pre_ping=True
+        pool_pre_ping=True,
+        **engine_options
     )
+    # A preloading server forks after this point; its workers reset the pool
+    # through this handle (see gunicorn.conf.py)
+    app.extensions["helios_engine"] = engine
 
-    # Import ALL models so their tables get created
+    # Import ALL models so their tables get created — the models package
+    # loads lazily, so each one must be named here
     from models.bond import Bond  # noqa: F401 — required for table creation
+    from models.transaction import Transaction  # noqa: F401
+    from models.reward import Reward  # noqa: F401
+    from models.token_pool import TokenPool  # noqa: F401
+    from models.wallet_tx import WalletTransaction  # noqa: F401
     from models.vault_receipt import VaultReceipt  # noqa: F401
     from models.certificate import Certificate  # noqa: F401
     from models.energy_event import EnergyEvent  # noqa: F401
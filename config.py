@@ -26,6 +26,8 @@ class HeliosConfig:
     HOST = os.getenv("HELIOS_HOST", "0.0.0.0")
     PORT = int(os.getenv("HELIOS_PORT", "5050"))
     DOMAIN = "xxxiii.io"
+    # Compiled Jinja templates, shared by every worker and kept across restarts
+    JINJA_CACHE_DIR = os.getenv("HELIOS_JINJA_CACHE_DIR", str(BASE_DIR / 'data' / 'jinja_cache'))
 
     # ——— Database —————————————————————————————————————————
     DATABASE_URL = os.getenv(
@@ -126,6 +128,13 @@ class HeliosConfig:
     TELNYX_FROM_NUMBER = os.getenv("HELIOS_TELNYX_FROM_NUMBER", "")
     TELNYX_VERIFY_EXPIRY_MINUTES = 10
     TELNYX_MAX_VERIFY_ATTEMPTS = 3
+    TELNYX_SENDS_PER_SECOND = 30            # Bulk send pacing + max in flight
+    # Keys the OTP hash. Unset → random per process; set it when using Redis
+    OTP_HASH_KEY = os.getenv("HELIOS_OTP_HASH_KEY", "")
+
+    # --- Redis (optional) — shared verification state across workers ---
+    # Unset → in-process store. Run Redis with maxmemory-policy allkeys-lru.
+    REDIS_URL = os.getenv("HELIOS_REDIS_URL", "")
 
     # ═══ ENTRY — ATOMIC $100 ═══════════════════════════════════════════
     # One price. One transaction. Mint + payment atomic.
@@ -13,12 +13,39 @@ RRR Covenant: Reserve Ratio < 1.0 = auto-pause redemptions. No override.
 """
 
 import hashlib
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from config import HeliosConfig
 from models.certificate import Certificate
 from models.member import Member
 
+# Final certificates never change again (no reactivation path), so their
+# to_dict() snapshot is safe to share across requests and workers. Keyed by
+# certificate_id and content_hash; bounded LRU. Active ones always hit the DB.
+_FINAL_CACHE_SIZE = 10_000
+_final_certs = OrderedDict()
+_final_lock = threading.Lock()
+
+
+def _remember_final(cert: dict):
+    with _final_lock:
+        for key in (cert["certificate_id"], cert["content_hash"]):
+            if key:
+                _final_certs[key] = cert
+                _final_certs.move_to_end(key)
+        while len(_final_certs) > _FINAL_CACHE_SIZE:
+            _final_certs.popitem(last=False)
+
+
+def _cached_final(key: str):
+    with _final_lock:
+        cert = _final_certs.get(key)
+        if cert is not None:
+            _final_certs.move_to_end(key)
+        return cert
+
 
 class CertificateEngine:
     """Stored energy batteries. Every certificate is cryptographically addressed."""
@@ -208,13 +235,20 @@ class CertificateEngine:
 
     def get_certificate(self, certificate_id: str) -> dict:
         """Get a certificate by ID or content hash."""
+        cached = _cached_final(certificate_id)
+        if cached is not None:
+            return dict(cached)
+
         cert = self.db.query(Certificate).filter_by(certificate_id=certificate_id).first()
         if not cert:
             # Try by content hash
             cert = self.db.query(Certificate).filter_by(content_hash=certificate_id).first()
         if not cert:
             raise ValueError(f"Certificate {certificate_id} not found")
-        return cert.to_dict()
+        result = cert.to_dict()
+        if cert.is_final:
+            _remember_final(dict(result))
+        return result
 
     def list_certificates(self, holder_id: str = None,
                            state: str = None, limit: int = 50) -> list:
@@ -270,6 +304,13 @@ class CertificateEngine:
 
     def _get_active_certificate(self, certificate_id: str) -> Certificate:
         """Get an active certificate or raise."""
+        final = _cached_final(certificate_id)
+        if final is not None and final["certificate_id"] == certificate_id:
+            raise ValueError(
+                f"Certificate {certificate_id} is final ({final['state']}). "
+                "No further actions permitted. This is irreversible."
+            )
+
         cert = self.db.query(Certificate).filter_by(certificate_id=certificate_id).first()
         if not cert:
             raise ValueError(f"Certificate {certificate_id} not found")
@@ -240,14 +240,19 @@ class EnergyExchange:
         Conservation Law: total inflows = routed + stored + pooled + ops + buffer
         Verify that the energy ledger balances.
         """
-        from sqlalchemy import func
+        from sqlalchemy import select
 
-        events = self.db.query(EnergyEvent).all()
+        # Full ledger replay — stream plain rows, no mapped instances
+        rows = self.db.execute(
+            select(EnergyEvent.event_type, EnergyEvent.amount_he)
+            .execution_options(yield_per=10_000)
+        )
 
         totals = {}
-        for e in events:
-            et = e.event_type
-            totals[et] = totals.get(et, 0.0) + e.amount_he
+        event_count = 0
+        for et, amount_he in rows:
+            totals[et] = totals.get(et, 0.0) + amount_he
+            event_count += 1
 
         total_in = totals.get(HeliosConfig.ENERGY_EVENT_IN, 0.0)
         total_routed = totals.get(HeliosConfig.ENERGY_EVENT_ROUTE, 0.0)
@@ -273,7 +278,7 @@ class EnergyExchange:
             "total_out": round(total_out, 2),
             "balance": balance,
             "balanced": abs(balance) < 0.01,
-            "event_count": len(events),
+            "event_count": event_count,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
 
@@ -299,9 +304,13 @@ class EnergyExchange:
 
     def get_energy_balance(self, member_id: str) -> dict:
         """Get total energy balance for a member — inflows minus outflows."""
-        events = self.db.query(EnergyEvent).filter(
-            (EnergyEvent.from_id == member_id) |
-            (EnergyEvent.to_id == member_id)
+        from sqlalchemy import select
+
+        events = self.db.execute(
+            select(EnergyEvent.from_id, EnergyEvent.to_id, EnergyEvent.amount_he).where(
+                (EnergyEvent.from_id == member_id) |
+                (EnergyEvent.to_id == member_id)
+            )
         ).all()
 
         inflows = sum(e.amount_he for e in events if e.to_id == member_id)
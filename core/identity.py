@@ -194,11 +194,19 @@ class HeliosIdentity:
     def _get_bond_count(self, helios_id: str) -> int:
         """Count active bonds for a node."""
         from models.bond import Bond
-        count = self.db.query(Bond).filter(
-            ((Bond.node_a == helios_id) | (Bond.node_b == helios_id)),
-            Bond.state == "active"
-        ).count()
-        return count
+        from sqlalchemy import func, select
+
+        # One covering-index count per direction; node_a != helios_id keeps
+        # the second leg from recounting a bond the first already matched
+        as_a, as_b = self.db.query(
+            select(func.count()).where(
+                Bond.node_a == helios_id, Bond.state == "active"
+            ).scalar_subquery(),
+            select(func.count()).where(
+                Bond.node_b == helios_id, Bond.node_a != helios_id, Bond.state == "active"
+            ).scalar_subquery()
+        ).one()
+        return as_a + as_b
 
     def _get_activity_score(self, helios_id: str) -> float:
         """Calculate activity score for the last 30 days."""
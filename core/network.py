@@ -6,10 +6,85 @@ No above. No below. Only connected peers inside a bounded field.
 Settlement follows rules, not relationships.
 """
 
+import threading
+from collections import Counter, OrderedDict
 from datetime import datetime, timezone, timedelta
-from collections import deque
 from config import HeliosConfig
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional accelerator — traversal falls back to pure Python
+    np = None
+    njit = None
+
+_COOLDOWN_SECONDS = HeliosConfig.FIELD_COOLDOWN_HOURS * 3600
+
+# weight(hop) = 1/(2^hop), precomputed across the energy horizon
+_DECAY_WEIGHTS = tuple(
+    1.0 / (HeliosConfig.PROPAGATION_DECAY_BASE ** h)
+    for h in range(HeliosConfig.PROPAGATION_MAX_HOPS + 2)
+)
+
+
+# ═══ Traversal Kernel ═════════════════════════════════════════════════
+def _bfs_kernel(indptr, indices, src, max_hops, order, hops, parent):
+    """
+    Level-synchronous breadth-first traversal over a CSR adjacency of dense
+    node indices. `hops` must arrive filled with -1 (unvisited). Each pass
+    expands the whole frontier order[level_start:level_end] and appends the
+    next level behind it, so `order` ends up grouped by hop. Fills
+    order/hops/parent in place and returns how many nodes were reached.
+    """
+    order[0] = src
+    hops[src] = 0
+    parent[src] = -1
+    level_start = 0
+    level_end = 1
+    hop = 0
+    while level_start < level_end and hop < max_hops:
+        tail = level_end
+        for f in range(level_start, level_end):
+            node = order[f]
+            for k in range(indptr[node], indptr[node + 1]):
+                peer = indices[k]
+                if hops[peer] < 0:
+                    hops[peer] = hop + 1
+                    parent[peer] = node
+                    order[tail] = peer
+                    tail += 1
+        level_start = level_end
+        level_end = tail
+        hop += 1
+    return level_end
+
+
+if njit is not None:
+    _bfs_kernel = njit(cache=True)(_bfs_kernel)
+
+
+def _bfs_reachable(indptr, indices, src, max_hops):
+    """Run the traversal kernel. Returns (order, hops, parent) over dense indices."""
+    n_nodes = len(indptr) - 1
+    if np is not None:
+        order = np.empty(n_nodes, dtype=np.int32)
+        hops = np.full(n_nodes, -1, dtype=np.int32)
+        parent = np.full(n_nodes, -1, dtype=np.int32)
+    else:
+        order = [0] * n_nodes
+        hops = [-1] * n_nodes
+        parent = [-1] * n_nodes
+    reached = _bfs_kernel(indptr, indices, src, max_hops, order, hops, parent)
+    return order[:reached], hops, parent
+
+
+# ═══ Path Cache ═══════════════════════════════════════════════════════
+# Shortest paths keyed by (from, to, bond epoch). Any bond change moves the
+# epoch, so stale entries are simply never hit again and age out of the LRU.
+_PATH_CACHE_SIZE = 1024
+_path_cache = OrderedDict()
+_path_cache_lock = threading.Lock()
+
 
 class FieldEngine:
     """
@@ -30,14 +105,17 @@ class FieldEngine:
         """
         from models.member import Member
         from models.bond import Bond
+        from sqlalchemy import select, union_all
 
-        # Validate both exist and are active
-        initiator = self.db.query(Member).filter_by(
-            helios_id=initiator_id, status="active"
-        ).first()
-        peer = self.db.query(Member).filter_by(
-            helios_id=peer_id, status="active"
-        ).first()
+        now = datetime.now(timezone.utc)
+
+        # Validate both exist and are active — one round-trip for both nodes
+        members = {m.helios_id: m for m in self.db.query(Member).filter(
+            Member.helios_id.in_([initiator_id, peer_id]),
+            Member.status == "active"
+        ).all()}
+        initiator = members.get(initiator_id)
+        peer = members.get(peer_id)
 
         if not initiator:
             raise ValueError(f"Node '{initiator_id}' not found in the field.")
@@ -61,18 +139,21 @@ class FieldEngine:
         # Normalize pair (undirected — always store lower ID first)
         node_a, node_b = Bond.ordered_pair(initiator_id, peer_id)
 
-        # Check for existing bond
-        existing = self.db.query(Bond).filter_by(
+        # Check for existing bond — (id, state) straight off the uq_bond_pair index
+        existing = self.db.query(Bond).with_entities(Bond.id, Bond.state).filter_by(
             node_a=node_a, node_b=node_b
-        ).first()
+        ).limit(1).first()
         if existing:
-            if existing.state == HeliosConfig.BOND_STATE_ACTIVE:
+            bond_id, state = existing
+            if state == HeliosConfig.BOND_STATE_ACTIVE:
                 raise ValueError("Bond already active between these nodes.")
-            if existing.state == HeliosConfig.BOND_STATE_INACTIVE:
+            if state == HeliosConfig.BOND_STATE_INACTIVE:
                 # Reactivate dormant bond
-                existing.state = HeliosConfig.BOND_STATE_ACTIVE
-                existing.activated_at = datetime.now(timezone.utc)
-                existing.deactivated_at = None
+                self.db.query(Bond).filter_by(id=bond_id).update({
+                    Bond.state: HeliosConfig.BOND_STATE_ACTIVE,
+                    Bond.activated_at: now,
+                    Bond.deactivated_at: None
+                })
                 initiator.bond_count += 1
                 peer.bond_count += 1
                 initiator.update_node_state()
@@ -80,21 +161,27 @@ class FieldEngine:
                 self.db.commit()
                 return {
                     "reactivated": True,
-                    "bond_id": existing.id,
+                    "bond_id": bond_id,
                     "nodes": [initiator_id, peer_id],
                     "message": f"Bond reactivated between {initiator_id} and {peer_id}."
                 }
 
         # Enforce cooldown
-        last_bond = self.db.query(Bond).filter(
-            (Bond.node_a == initiator_id) | (Bond.node_b == initiator_id)
-        ).order_by(Bond.created_at.desc()).first()
+        legs = union_all(
+            select(Bond.created_at).where(Bond.node_a == initiator_id),
+            select(Bond.created_at).where(Bond.node_b == initiator_id)
+        ).subquery()
+        last_bond = self.db.execute(
+            select(legs.c.created_at).order_by(legs.c.created_at.desc()).limit(1)
+        ).first()
 
         if last_bond:
-            cooldown = timedelta(hours=HeliosConfig.FIELD_COOLDOWN_HOURS)
-            if datetime.now(timezone.utc) - last_bond.created_at < cooldown:
-                remaining = cooldown - (datetime.now(timezone.utc) - last_bond.created_at)
-                hours = int(remaining.total_seconds() // 3600)
+            last_created = last_bond.created_at
+            if last_created.tzinfo is None:
+                last_created = last_created.replace(tzinfo=timezone.utc)  # SQLite drops tzinfo
+            elapsed = now.timestamp() - last_created.timestamp()
+            if elapsed < _COOLDOWN_SECONDS:
+                hours = int((_COOLDOWN_SECONDS - elapsed) // 3600)
                 raise ValueError(
                     f"Bond cooldown active. Wait {hours} more hours. "
                     "This prevents artificial saturation."
@@ -106,8 +193,8 @@ class FieldEngine:
             node_b=node_b,
             state=HeliosConfig.BOND_STATE_ACTIVE,
             initiated_by=initiator_id,
-            created_at=datetime.now(timezone.utc),
-            activated_at=datetime.now(timezone.utc)
+            created_at=now,
+            activated_at=now
         )
         self.db.add(bond)
 
@@ -145,8 +232,11 @@ class FieldEngine:
         bond.deactivated_at = datetime.now(timezone.utc)
 
         # Update bond counts
-        node = self.db.query(Member).filter_by(helios_id=node_id).first()
-        peer = self.db.query(Member).filter_by(helios_id=peer_id).first()
+        members = {m.helios_id: m for m in self.db.query(Member).filter(
+            Member.helios_id.in_([node_id, peer_id])
+        ).all()}
+        node = members.get(node_id)
+        peer = members.get(peer_id)
         if node:
             node.bond_count = max(0, node.bond_count - 1)
             node.update_node_state()
@@ -167,22 +257,29 @@ class FieldEngine:
         if max_hops is None:
             max_hops = min(HeliosConfig.PROPAGATION_MAX_HOPS, 6)  # Viz default
 
-        from models.bond import Bond
         from models.member import Member
 
-        visited = {}  # helios_id → hop distance
-        nodes = []
-        edges = []
-        queue = deque([(helios_id, 0)])
-        visited[helios_id] = 0
+        adjacency = self._load_adjacency()
+        index = adjacency["index"]
+        if helios_id in index:
+            order, hops, _ = _bfs_reachable(
+                adjacency["indptr"], adjacency["indices"], index[helios_id], max_hops
+            )
+            reached = [(adjacency["ids"][i], int(hops[i])) for i in order]
+        else:
+            reached = [(helios_id, 0)]  # Isolated node — no active bonds
 
-        while queue:
-            current_id, hops = queue.popleft()
-            if hops > max_hops:
-                continue
+        members = {
+            m.helios_id: m for m in self.db.query(Member).filter(
+                Member.helios_id.in_([node_id for node_id, _ in reached])
+            ).all()
+        }
 
-            # Get node info
-            member = self.db.query(Member).filter_by(helios_id=current_id).first()
+        nodes = []
+        edges = []
+        seen_edges = set()
+        for current_id, hops in reached:
+            member = members.get(current_id)
             if member:
                 nodes.append({
                     "id": current_id,
@@ -192,33 +289,27 @@ class FieldEngine:
                     "bond_count": member.bond_count,
                     "activity": self._get_activity_score(current_id),
                     "is_origin": current_id == helios_id,
-                    "energy_weight": 1.0 / (HeliosConfig.PROPAGATION_DECAY_BASE ** hops) if hops > 0 else 1.0
+                    "energy_weight": _DECAY_WEIGHTS[hops] if hops < len(_DECAY_WEIGHTS)
+                    else 1.0 / (HeliosConfig.PROPAGATION_DECAY_BASE ** hops)
                 })
 
-            # Get all active bonds for this node (undirected)
-            bonds = self.db.query(Bond).filter(
-                ((Bond.node_a == current_id) | (Bond.node_b == current_id)),
-                Bond.state == HeliosConfig.BOND_STATE_ACTIVE
-            ).all()
-
-            for bond in bonds:
-                peer_id = bond.peer_of(current_id)
+            # Every active bond of a reached node is an edge (deduplicated)
+            if current_id not in index:
+                continue
+            current = index[current_id]
+            for k in range(adjacency["indptr"][current], adjacency["indptr"][current + 1]):
+                peer_id = adjacency["ids"][adjacency["indices"][k]]
                 edge_key = tuple(sorted([current_id, peer_id]))
-
-                # Add edge (deduplicated)
-                if not any(e["key"] == edge_key for e in edges):
-                    edges.append({
-                        "source": current_id,
-                        "target": peer_id,
-                        "key": edge_key,
-                        "state": bond.state,
-                        "since": bond.created_at.isoformat()
-                    })
-
-                # Traverse to peer if not visited and within range
-                if peer_id not in visited and hops + 1 <= max_hops:
-                    visited[peer_id] = hops + 1
-                    queue.append((peer_id, hops + 1))
+                if edge_key in seen_edges:
+                    continue
+                seen_edges.add(edge_key)
+                edges.append({
+                    "source": current_id,
+                    "target": peer_id,
+                    "key": edge_key,
+                    "state": HeliosConfig.BOND_STATE_ACTIVE,
+                    "since": adjacency["since"][k].isoformat()
+                })
 
         return {
             "origin": helios_id,
@@ -233,11 +324,20 @@ class FieldEngine:
         """Get all active bonds for a node — its direct peers."""
         from models.bond import Bond
         from models.member import Member
+        from sqlalchemy import select, union_all
 
-        bonds = self.db.query(Bond).filter(
-            ((Bond.node_a == helios_id) | (Bond.node_b == helios_id)),
-            Bond.state == HeliosConfig.BOND_STATE_ACTIVE
-        ).all()
+        bonds = self.db.execute(select(Bond).from_statement(union_all(
+            select(Bond).where(
+                Bond.node_a == helios_id,
+                Bond.state == HeliosConfig.BOND_STATE_ACTIVE
+            ),
+            select(Bond).where(
+                Bond.node_b == helios_id,
+                Bond.node_a != helios_id,
+                Bond.state == HeliosConfig.BOND_STATE_ACTIVE
+            )
+        ))).scalars().all()
+        bonds.sort(key=lambda bond: bond.id)  # Stable peer order across both legs
 
         result = []
         for bond in bonds:
@@ -256,36 +356,42 @@ class FieldEngine:
 
     def get_propagation_path(self, from_id: str, to_id: str) -> dict:
         """Find shortest path between two nodes via BFS. Used for settlement routing."""
-        from models.bond import Bond
-
         if from_id == to_id:
             return {"path": [from_id], "hops": 0}
 
-        visited = {from_id: None}
-        queue = deque([from_id])
-
-        while queue:
-            current = queue.popleft()
-
-            bonds = self.db.query(Bond).filter(
-                ((Bond.node_a == current) | (Bond.node_b == current)),
-                Bond.state == HeliosConfig.BOND_STATE_ACTIVE
-            ).all()
-
-            for bond in bonds:
-                peer = bond.peer_of(current)
-                if peer not in visited:
-                    visited[peer] = current
-                    if peer == to_id:
-                        # Reconstruct path
-                        path = [to_id]
-                        node = to_id
-                        while visited[node] is not None:
-                            node = visited[node]
-                            path.append(node)
-                        path.reverse()
-                        return {"path": path, "hops": len(path) - 1}
-                    queue.append(peer)
+        key = (from_id, to_id, self._bond_epoch())
+        with _path_cache_lock:
+            cached = _path_cache.get(key)
+            if cached is not None:
+                _path_cache.move_to_end(key)
+        if cached is None:
+            cached = self._find_path(from_id, to_id)
+            with _path_cache_lock:
+                _path_cache[key] = cached
+                if len(_path_cache) > _PATH_CACHE_SIZE:
+                    _path_cache.popitem(last=False)
+
+        return {**cached, "path": list(cached["path"])}
+
+    def _find_path(self, from_id: str, to_id: str) -> dict:
+        """Uncached BFS behind get_propagation_path."""
+        adjacency = self._load_adjacency()
+        index = adjacency["index"]
+        if from_id in index and to_id in index:
+            indptr = adjacency["indptr"]
+            _, hops, parent = _bfs_reachable(
+                indptr, adjacency["indices"], index[from_id], len(indptr) - 1
+            )
+            target = index[to_id]
+            if hops[target] >= 0:
+                # Reconstruct path
+                path = []
+                node = target
+                while node >= 0:
+                    path.append(adjacency["ids"][node])
+                    node = int(parent[node])
+                path.reverse()
+                return {"path": path, "hops": len(path) - 1}
 
         return {"path": [], "hops": -1, "message": "No path exists between these nodes."}
 
@@ -305,12 +411,7 @@ class FieldEngine:
         capacity = member.bond_count / HeliosConfig.FIELD_MAX_BONDS * 100
 
         # Field reach at different distances
-        hop_distribution = {}
-        for node in field["nodes"]:
-            h = node["hops"]
-            if h not in hop_distribution:
-                hop_distribution[h] = 0
-            hop_distribution[h] += 1
+        hop_distribution = dict(Counter(node["hops"] for node in field["nodes"]))
 
         return {
             "helios_id": helios_id,
@@ -353,6 +454,65 @@ class FieldEngine:
         }
 
     # ═══ Internal Helpers ═════════════════════════════════════════════
+    def _bond_epoch(self) -> tuple:
+        """
+        Fingerprint of the bond table. Forming a bond adds a row, dissolving
+        stamps deactivated_at, reactivating stamps activated_at — each moves
+        one of these maxima. Read from the DB so every worker process agrees.
+        """
+        from models.bond import Bond
+        from sqlalchemy import func
+
+        return tuple(self.db.query(
+            func.max(Bond.id),
+            func.max(Bond.activated_at),
+            func.max(Bond.deactivated_at)
+        ).one())
+
+    def _load_adjacency(self) -> dict:
+        """
+        Load every active bond in one query and lay the field out as CSR:
+        node i's peers are indices[indptr[i]:indptr[i + 1]], and since[k]
+        is the creation time of the bond behind indices[k].
+        """
+        from models.bond import Bond
+
+        rows = self.db.query(Bond.node_a, Bond.node_b, Bond.created_at).filter(
+            Bond.state == HeliosConfig.BOND_STATE_ACTIVE
+        ).order_by(Bond.id).all()
+
+        index = {}  # helios_id → dense node index
+        ids = []
+        for node_a, node_b, _ in rows:
+            for node_id in (node_a, node_b):
+                if node_id not in index:
+                    index[node_id] = len(ids)
+                    ids.append(node_id)
+
+        indptr = [0] * (len(ids) + 1)
+        for node_a, node_b, _ in rows:
+            indptr[index[node_a] + 1] += 1
+            indptr[index[node_b] + 1] += 1
+        for i in range(len(ids)):
+            indptr[i + 1] += indptr[i]
+
+        cursor = indptr[:-1]
+        indices = [0] * indptr[-1]
+        since = [None] * indptr[-1]
+        for node_a, node_b, created_at in rows:
+            a, b = index[node_a], index[node_b]
+            indices[cursor[a]], since[cursor[a]] = b, created_at
+            indices[cursor[b]], since[cursor[b]] = a, created_at
+            cursor[a] += 1
+            cursor[b] += 1
+
+        if np is not None:
+            indptr = np.asarray(indptr, dtype=np.int32)
+            indices = np.asarray(indices, dtype=np.int32)
+
+        return {"index": index, "ids": ids, "indptr": indptr,
+                "indices": indices, "since": since}
+
     def _get_activity_score(self, helios_id: str) -> float:
         """Activity score for the rolling window."""
         from models.transaction import Transaction
@@ -0,0 +1,34 @@
+"""
+Keyset Pagination — shared cursor format for paged listings
+═══════════════════════════════════════════════════════════════════════
+Listings run newest first. A cursor is the created_at of the last row served
+plus the integer keys that order rows sharing that timestamp (the row id,
+and for merged listings the source rank ahead of it), so rows tied on
+created_at are never skipped or repeated at a page boundary.
+"""
+
+from datetime import datetime
+
+MAX_PAGE_SIZE = 200
+
+
+def page_limit(limit: int) -> int:
+    """Validate a requested page size; oversized pages are capped."""
+    if limit < 1:
+        raise ValueError("limit must be at least 1")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def encode_cursor(created_at: datetime, *keys: int) -> str:
+    """Cursor for the row at (created_at, *keys): '<iso timestamp>_<key>_...'."""
+    return "_".join([created_at.isoformat(), *map(str, keys)])
+
+
+def decode_cursor(cursor: str, keys: int = 1):
+    """Inverse of encode_cursor → (created_at, *keys), or None for the first page."""
+    if not cursor:
+        return None
+    parts = cursor.split("_")
+    if len(parts) != keys + 1 or not all(p.isdigit() for p in parts[1:]):
+        raise ValueError("Invalid cursor")
+    return (datetime.fromisoformat(parts[0]), *map(int, parts[1:]))
@@ -9,9 +9,16 @@ After hop 15, fractional remainder absorbs into protocol stability pools.
 
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal, ROUND_DOWN
-from collections import deque
 from config import HeliosConfig
 
+# Absorption split for the fractional remainder — stability first (receives dust)
+ABSORPTION_POOLS = (
+    ("POOL:stability", HeliosConfig.ABSORPTION_STABILITY_PERCENT),
+    ("POOL:liquidity", HeliosConfig.ABSORPTION_LIQUIDITY_PERCENT),
+    ("POOL:intelligence", HeliosConfig.ABSORPTION_INTELLIGENCE_PERCENT),
+    ("POOL:compliance", HeliosConfig.ABSORPTION_COMPLIANCE_PERCENT),
+)
+
 
 class PropagationEngine:
     """
@@ -35,8 +42,8 @@ class PropagationEngine:
         Returns a full breakdown: acknowledgement + hop-by-hop distribution + absorption.
         """
         from models.member import Member
-        from models.bond import Bond
 
+        now = datetime.now(timezone.utc)
         origin = self.db.query(Member).filter_by(
             helios_id=origin_id, status="active"
         ).first()
@@ -53,7 +60,7 @@ class PropagationEngine:
                 helios_id=origin.referrer_id, status="active"
             ).first()
 
-            if initiator and self._get_activity_score(initiator.helios_id) >= HeliosConfig.SETTLEMENT_MIN_ACTIVITY_SCORE:
+            if initiator and self._get_activity_score(initiator.helios_id, now) >= HeliosConfig.SETTLEMENT_MIN_ACTIVITY_SCORE:
                 distributions.append({
                     "recipient": initiator.helios_id,
                     "amount": float(ack_amount),
@@ -80,62 +87,70 @@ class PropagationEngine:
         if propagation_energy <= 0:
             propagation_energy = energy_amount  # For non-join events
 
+        # A hop's share is energy / base^hop in 1e-8 quanta, zero once
+        # base^hop exceeds the quanta available — the traversal stops at the
+        # last hop that can still pay out instead of walking to the horizon.
+        quanta = max(int(propagation_energy / Decimal('0.00000001')), 0)
+        max_effective_hop = 0
+        while (max_effective_hop < HeliosConfig.PROPAGATION_MAX_HOPS and
+               Decimal(str(HeliosConfig.PROPAGATION_DECAY_BASE ** (max_effective_hop + 1))) <= quanta):
+            max_effective_hop += 1
+
         visited = {origin_id: 0}
-        queue = deque([(origin_id, 0)])
+        frontier = [origin_id]
+        hop = 0
         hop_distributions = []
 
-        while queue:
-            current_id, hop = queue.popleft()
-
-            # Get active bonds from current node
-            bonds = self.db.query(Bond).filter(
-                ((Bond.node_a == current_id) | (Bond.node_b == current_id)),
-                Bond.state == HeliosConfig.BOND_STATE_ACTIVE
-            ).all()
-
-            for bond in bonds:
-                peer_id = bond.peer_of(current_id)
-                next_hop = hop + 1
-
-                if peer_id in visited:
-                    continue  # Already reached via shorter path
-                if next_hop > HeliosConfig.PROPAGATION_MAX_HOPS:
-                    continue  # Beyond energy horizon
-
-                visited[peer_id] = next_hop
-
-                # Calculate energy weight: 1/(2^hop)
-                weight = Decimal('1') / Decimal(str(HeliosConfig.PROPAGATION_DECAY_BASE ** next_hop))
-                hop_amount = (propagation_energy * weight).quantize(
-                    Decimal('0.00000001'), rounding=ROUND_DOWN
-                )
-
-                if hop_amount <= 0:
-                    continue
-
-                # Check if peer is active enough to receive energy
-                peer_score = self._get_activity_score(peer_id)
-                if peer_score >= HeliosConfig.SETTLEMENT_MIN_ACTIVITY_SCORE:
-                    hop_distributions.append({
-                        "recipient": peer_id,
-                        "amount": float(hop_amount),
-                        "type": "propagation",
-                        "hop": next_hop,
-                        "weight": float(weight),
-                        "reason": f"Energy propagation at hop {next_hop}"
-                    })
-                else:
-                    hop_distributions.append({
-                        "recipient": "POOL:stability",
-                        "amount": float(hop_amount),
-                        "type": "absorption",
-                        "hop": next_hop,
-                        "weight": float(weight),
-                        "reason": f"Inactive node at hop {next_hop} — absorbed"
-                    })
-
-                total_propagated += hop_amount
-                queue.append((peer_id, next_hop))
+        # Level-synchronous expansion: one bond query per hop, not per node
+        while frontier and hop < max_effective_hop:
+            next_hop = hop + 1
+            next_frontier = []
+
+            bonds_by_node = self._get_frontier_bonds(frontier)
+            for current_id in frontier:
+                for bond in bonds_by_node.get(current_id, ()):
+                    peer_id = bond.peer_of(current_id)
+
+                    if peer_id in visited:
+                        continue  # Already reached via shorter path
+
+                    visited[peer_id] = next_hop
+
+                    # Calculate energy weight: 1/(2^hop)
+                    weight = Decimal('1') / Decimal(str(HeliosConfig.PROPAGATION_DECAY_BASE ** next_hop))
+                    hop_amount = (propagation_energy * weight).quantize(
+                        Decimal('0.00000001'), rounding=ROUND_DOWN
+                    )
+
+                    if hop_amount <= 0:
+                        continue
+
+                    # Check if peer is active enough to receive energy
+                    peer_score = self._get_activity_score(peer_id, now)
+                    if peer_score >= HeliosConfig.SETTLEMENT_MIN_ACTIVITY_SCORE:
+                        hop_distributions.append({
+                            "recipient": peer_id,
+                            "amount": float(hop_amount),
+                            "type": "propagation",
+                            "hop": next_hop,
+                            "weight": float(weight),
+                            "reason": f"Energy propagation at hop {next_hop}"
+                        })
+                    else:
+                        hop_distributions.append({
+                            "recipient": "POOL:stability",
+                            "amount": float(hop_amount),
+                            "type": "absorption",
+                            "hop": next_hop,
+                            "weight": float(weight),
+                            "reason": f"Inactive node at hop {next_hop} — absorbed"
+                        })
+
+                    total_propagated += hop_amount
+                    next_frontier.append(peer_id)
+
+            frontier = next_frontier
+            hop = next_hop
 
         distributions.extend(hop_distributions)
 
@@ -154,7 +169,7 @@ class PropagationEngine:
             "distribution_count": len(distributions),
             "max_hop_reached": max((d["hop"] for d in distributions), default=0),
             "distributions": distributions,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": now.isoformat(),
             "verifiable": True
         }
 
@@ -164,27 +179,28 @@ class PropagationEngine:
         from models.reward import Reward
 
         calc = self.calculate_propagation(origin_id, energy_amount, event_type)
-
-        # Record each distribution
-        reward_records = []
-        for dist in calc["distributions"]:
-            reward = Reward(
-                member_id=dist["recipient"],
-                source_member_id=origin_id,
-                amount=dist["amount"],
-                reward_type=dist["type"],
-                activity_type=event_type,
-                reason=dist["reason"],
-                created_at=datetime.now(timezone.utc),
-                status="settled"
-            )
-            self.db.add(reward)
-            reward_records.append(reward)
+        now = datetime.now(timezone.utc)
+
+        # Record every distribution in one bulk insert
+        rows = [
+            {
+                "member_id": dist["recipient"],
+                "source_member_id": origin_id,
+                "amount": dist["amount"],
+                "reward_type": dist["type"],
+                "activity_type": event_type,
+                "reason": dist["reason"],
+                "created_at": now,
+                "status": "settled",
+            }
+            for dist in calc["distributions"]
+        ]
+        settlement_ids = Reward.bulk_record(self.db, rows, return_ids=True)
 
         self.db.commit()
 
         calc["executed"] = True
-        calc["settlement_ids"] = [r.id for r in reward_records]
+        calc["settlement_ids"] = settlement_ids
         return calc
 
     # ═══ Absorption Pool Distribution ═════════════════════════════════
@@ -193,17 +209,10 @@ class PropagationEngine:
         Split fractional remainder into protocol pools.
         Stability 40% | Liquidity 25% | Intelligence 20% | Compliance 15%
         """
-        pools = [
-            ("POOL:stability", HeliosConfig.ABSORPTION_STABILITY_PERCENT),
-            ("POOL:liquidity", HeliosConfig.ABSORPTION_LIQUIDITY_PERCENT),
-            ("POOL:intelligence", HeliosConfig.ABSORPTION_INTELLIGENCE_PERCENT),
-            ("POOL:compliance", HeliosConfig.ABSORPTION_COMPLIANCE_PERCENT),
-        ]
-
         distributions = []
         distributed = Decimal('0')
 
-        for pool_name, percent in pools:
+        for pool_name, percent in ABSORPTION_POOLS:
             amount = (remainder * Decimal(str(percent)) / Decimal('100')).quantize(
                 Decimal('0.00000001'), rounding=ROUND_DOWN
             )
@@ -228,20 +237,27 @@ class PropagationEngine:
     def get_settlement_history(self, helios_id: str, limit: int = 50) -> list:
         """Get settlement history for a node."""
         from models.reward import Reward
+        from models.member import Member
 
-        rewards = self.db.query(Reward).filter_by(
-            member_id=helios_id
-        ).order_by(Reward.created_at.desc()).limit(limit).all()
+        # Column projection streamed off the cursor — no ORM identity map
+        rows = self.db.query(
+            Reward.id, Reward.amount, Reward.reward_type, Reward.source_member_id,
+            Member.display_name, Reward.reason, Reward.created_at, Reward.status
+        ).outerjoin(Reward.source_member).filter(
+            Reward.member_id == helios_id
+        ).order_by(Reward.created_at.desc()).limit(limit).yield_per(100)
 
         return [{
-            "id": r.id,
-            "amount": r.amount,
-            "type": r.reward_type,
-            "source": r.source_member_id,
-            "reason": r.reason,
-            "date": r.created_at.isoformat(),
-            "status": r.status
-        } for r in rewards]
+            "id": reward_id,
+            "amount": amount,
+            "type": reward_type,
+            "source": source_id,
+            "source_name": source_name,
+            "reason": reason,
+            "date": created_at.isoformat(),
+            "status": status
+        } for (reward_id, amount, reward_type, source_id, source_name,
+               reason, created_at, status) in rows]
 
     def get_total_energy_received(self, helios_id: str) -> dict:
         """Total energy received, broken down by type."""
@@ -277,19 +293,15 @@ class PropagationEngine:
         from models.reward import Reward
         from sqlalchemy import func
 
-        total_distributed = self.db.query(
-            func.sum(Reward.amount)
+        # One grouped pass over the (status, member_id) index instead of two filtered sums
+        totals = {bool(is_pool): total for is_pool, total in self.db.query(
+            Reward.is_pool, func.sum(Reward.amount)
         ).filter(
-            Reward.status == "settled",
-            ~Reward.member_id.startswith("POOL")
-        ).scalar() or 0
+            Reward.status == "settled"
+        ).group_by(Reward.is_pool).all()}
 
-        pool_balance = self.db.query(
-            func.sum(Reward.amount)
-        ).filter(
-            Reward.status == "settled",
-            Reward.member_id.startswith("POOL")
-        ).scalar() or 0
+        total_distributed = totals.get(False) or 0
+        pool_balance = totals.get(True) or 0
 
         pool_max = HeliosConfig.TOKEN_TOTAL_SUPPLY * HeliosConfig.TOKEN_POOL_LOCK_PERCENT / 100
 
@@ -315,10 +327,39 @@ class PropagationEngine:
         }
 
     # ═══ Helpers ══════════════════════════════════════════════════════
-    def _get_activity_score(self, helios_id: str) -> float:
+    def _get_frontier_bonds(self, frontier: list) -> dict:
+        """Active bonds touching any frontier node, grouped by that node."""
+        from models.bond import Bond
+
+        from sqlalchemy import select, union_all
+
+        # One covering-index leg per direction; the second skips bonds the
+        # first already returned (both ends on the frontier)
+        bonds = self.db.execute(select(Bond).from_statement(union_all(
+            select(Bond).where(
+                Bond.node_a.in_(frontier),
+                Bond.state == HeliosConfig.BOND_STATE_ACTIVE
+            ),
+            select(Bond).where(
+                Bond.node_b.in_(frontier),
+                Bond.node_a.not_in(frontier),
+                Bond.state == HeliosConfig.BOND_STATE_ACTIVE
+            )
+        ))).scalars().all()
+        bonds.sort(key=lambda bond: bond.id)  # Deterministic traversal order across both legs
+
+        members = set(frontier)
+        bonds_by_node = {}
+        for bond in bonds:
+            for node_id in (bond.node_a, bond.node_b):
+                if node_id in members:
+                    bonds_by_node.setdefault(node_id, []).append(bond)
+        return bonds_by_node
+
+    def _get_activity_score(self, helios_id: str, now: datetime = None) -> float:
         """Activity score for settlement qualification."""
         from models.transaction import Transaction
-        cutoff = datetime.now(timezone.utc) - timedelta(
+        cutoff = (now or datetime.now(timezone.utc)) - timedelta(
             days=HeliosConfig.FIELD_ACTIVITY_WINDOW_DAYS
         )
         count = self.db.query(Transaction).filter(
@@ -5,12 +5,150 @@ Phone verification for onboarding. SMS notifications for rewards.
 No spam. Only things you asked for.
 """
 
+import asyncio
 import hashlib
+import hmac
+import logging
+import re
 import secrets
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
 from config import HeliosConfig
 
+_PHONE_STRIP = re.compile(r'[^\d+]')
+# ASCII delete table for the common case; _PHONE_STRIP covers the rest
+_PHONE_DELETE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if chr(i) not in "0123456789+"
+))
+# Display masks by phone length (E.164 tops out at 16 chars)
+_MASK_BY_LEN = {n: "*" * max(0, n - 7) for n in range(6, 20)}
+# Message templates — filled with str.format per send
+_VERIFY_TEMPLATE = (
+    "☀️ Helios Verification\n\n"
+    "Your code: {code}\n\n"
+    "Expires in {mins} minutes.\n"
+    "Never share this code with anyone."
+)
+_REWARD_TEMPLATE = (
+    "☀️ Helios Reward\n\n"
+    "You earned {amount:.2f} HLS!\n"
+    "Type: {reward_type}\n"
+    "Account: {helios_id}\n\n"
+    "View details in your dashboard."
+)
+_ALERT_TEMPLATES = {
+    "login": "☀️ Security Alert\n\nNew login detected for {helios_id}.\nIf this wasn't you, recover your account immediately.",
+    "recovery": "☀️ Security Alert\n\nAccount recovery initiated for {helios_id}.\nIf this wasn't you, contact support immediately.",
+    "large_transfer": "☀️ Security Alert\n\nA large transfer was made from {helios_id}.\nIf this wasn't you, recover your account immediately."
+}
+_DEFAULT_ALERT = "☀️ Security Alert for {helios_id}"
+_TELNYX_MESSAGES_URL = "https://api.telnyx.com/v2/messages"
+_VERIFY_KEY = "helios:verif:{}"
+
+# Keyed BLAKE2b-160 over OTP codes; any configured secret is folded to 32 bytes
+if HeliosConfig.OTP_HASH_KEY:
+    _OTP_KEY = hashlib.sha256(HeliosConfig.OTP_HASH_KEY.encode()).digest()
+else:
+    _OTP_KEY = secrets.token_bytes(32)
+    if HeliosConfig.REDIS_URL:
+        logging.getLogger('helios').warning(
+            'HELIOS_OTP_HASH_KEY unset — using a per-process key; '
+            'verification codes will not validate across workers'
+        )
+_BUCKET_KEY = "helios:ratelimit:{}"
+
+# Atomic check-refill-spend for a per-phone token bucket.
+# KEYS[1] bucket hash · ARGV capacity, refill rate/s, now, ttl → 1 allowed / 0 limited
+_RATE_LIMIT_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('HMGET', KEYS[1], 'tok', 'ts')
+local tokens = tonumber(bucket[1])
+if tokens == nil then
+    tokens = capacity
+else
+    tokens = math.min(capacity, tokens + (now - tonumber(bucket[2])) * rate)
+end
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tok', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[4]))
+return allowed
+"""
+
+# Atomic expiry check, attempt count, hash compare and consume for a verification.
+# KEYS[1] verification hash · ARGV code hash, now, expiry seconds, max attempts
+# → {status, attempts remaining, phone, helios_id}
+_VERIFY_LUA = """
+local v = redis.call('HMGET', KEYS[1], 'code', 'created_at', 'phone', 'helios_id')
+if not v[1] then
+    return {'missing', 0, '', ''}
+end
+if tonumber(ARGV[2]) - tonumber(v[2]) > tonumber(ARGV[3]) then
+    redis.call('DEL', KEYS[1])
+    return {'expired', 0, '', ''}
+end
+local attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+local max_attempts = tonumber(ARGV[4])
+if attempts > max_attempts then
+    redis.call('DEL', KEYS[1])
+    return {'too_many', 0, '', ''}
+end
+if v[1] ~= ARGV[1] then
+    return {'wrong', max_attempts - attempts, '', ''}
+end
+redis.call('DEL', KEYS[1])
+return {'ok', 0, v[3], v[4]}
+"""
+
+_redis = None
+_rate_limit_script = None
+_verify_script = None
+_client = None
+
+
+def _hash_code(code: str) -> bytes:
+    return hashlib.blake2b(code.encode(), digest_size=20, key=_OTP_KEY).digest()
+
+
+def _get_client():
+    """Shared HTTP/2 keep-alive client for Telnyx — calls multiplex on pooled connections."""
+    global _client
+    if _client is None:
+        import httpx
+
+        # Transport retries cover connect failures only; sends are never resent
+        _client = httpx.Client(
+            timeout=15.0,
+            headers={
+                "Authorization": f"Bearer {HeliosConfig.TELNYX_API_KEY}",
+                "Content-Type": "application/json"
+            },
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+            )
+        )
+    return _client
+
+
+def _get_redis():
+    """Shared Redis client when HELIOS_REDIS_URL is set, else None."""
+    global _redis, _rate_limit_script, _verify_script
+    if _redis is None and HeliosConfig.REDIS_URL:
+        import redis
+        _redis = redis.Redis.from_url(HeliosConfig.REDIS_URL)
+        _rate_limit_script = _redis.register_script(_RATE_LIMIT_LUA)
+        _verify_script = _redis.register_script(_VERIFY_LUA)
+    return _redis
+
 
 class HeliosSMS:
     """
@@ -20,8 +158,22 @@ class HeliosSMS:
     - Security alerts
     """
 
-    # In-memory verification store (production: use Redis or DB)
-    _pending_verifications = {}
+    # In-process verification store — used when HELIOS_REDIS_URL is unset.
+    # Insertion order is creation order, so expired entries sit at the head.
+    _pending_verifications = OrderedDict()
+    _pending_lock = threading.Lock()
+
+    # Per-phone token buckets: phone → [tokens, last_refill (monotonic)]
+    _phone_buckets = {}
+    _bucket_checks = 0
+    _bucket_lock = threading.Lock()
+    RATE_LIMIT_CODES = 3                    # Bucket capacity — codes per phone
+    RATE_LIMIT_WINDOW = 3600                # Seconds to refill a full bucket
+
+    # Last good Telnyx balance — status checks reuse it for BALANCE_CACHE_TTL
+    BALANCE_CACHE_TTL = 30
+    _balance_cache = {"ts": 0.0, "data": None}
+    _balance_lock = threading.Lock()
 
     def __init__(self, db_session=None):
         self.db = db_session
@@ -30,6 +182,7 @@ class HeliosSMS:
         self.available = bool(self.api_key)
         self.expiry_minutes = HeliosConfig.TELNYX_VERIFY_EXPIRY_MINUTES
         self.max_attempts = HeliosConfig.TELNYX_MAX_VERIFY_ATTEMPTS
+        self.redis = _get_redis()
 
     # ─── Phone Verification ────────────────────────────────────────────
 
@@ -60,27 +213,21 @@ class HeliosSMS:
                 "error": "Too many verification attempts. Please wait and try again."
             }
 
-        # Generate 6-digit code
-        code = f"{secrets.randbelow(900000) + 100000}"
-        verification_id = secrets.token_hex(16)
+        # Generate 6-digit code — one 64-bit draw, modulo bias ~1e-13
+        code = f"{int.from_bytes(secrets.token_bytes(8), 'big') % 900000 + 100000}"
+        verification_id = secrets.token_urlsafe(16)
 
         # Store verification
-        self._pending_verifications[verification_id] = {
+        self._store_verification(verification_id, {
             "phone": phone,
-            "code": hashlib.sha256(code.encode()).hexdigest(),
+            "code": _hash_code(code),
             "helios_id": helios_id,
             "created_at": time.time(),
-            "attempts": 0,
-            "verified": False
-        }
+            "attempts": 0
+        })
 
         # Send SMS
-        message = (
-            f"☀️ Helios Verification\n\n"
-            f"Your code: {code}\n\n"
-            f"Expires in {self.expiry_minutes} minutes.\n"
-            f"Never share this code with anyone."
-        )
+        message = _VERIFY_TEMPLATE.format(code=code, mins=self.expiry_minutes)
 
         try:
             result = self._send_sms(phone, message)
@@ -95,7 +242,7 @@ class HeliosSMS:
 
         except Exception as e:
             # Clean up on failure
-            del self._pending_verifications[verification_id]
+            self._delete_verification(verification_id)
             return {
                 "sent": False,
                 "error": f"Failed to send SMS: {str(e)}"
@@ -105,53 +252,34 @@ class HeliosSMS:
         """
         Verify a phone number with the code received via SMS.
         """
-        pending = self._pending_verifications.get(verification_id)
+        code_hash = _hash_code(code.strip())
+        status, remaining, phone, helios_id = self._check_code(verification_id, code_hash)
 
-        if not pending:
+        if status == "missing":
             return {
                 "verified": False,
                 "error": "Verification not found or expired"
             }
-
-        # Check expiry
-        elapsed = time.time() - pending["created_at"]
-        if elapsed > self.expiry_minutes * 60:
-            del self._pending_verifications[verification_id]
+        if status == "expired":
             return {
                 "verified": False,
                 "error": "Verification code expired. Please request a new one."
             }
-
-        # Check attempts
-        pending["attempts"] += 1
-        if pending["attempts"] > self.max_attempts:
-            del self._pending_verifications[verification_id]
+        if status == "too_many":
             return {
                 "verified": False,
                 "error": "Too many failed attempts. Please request a new code."
             }
-
-        # Verify code
-        code_hash = hashlib.sha256(code.strip().encode()).hexdigest()
-        if code_hash != pending["code"]:
-            remaining = self.max_attempts - pending["attempts"]
+        if status == "wrong":
             return {
                 "verified": False,
                 "error": f"Wrong code. {remaining} attempts remaining."
             }
 
-        # Success — mark as verified
-        pending["verified"] = True
-        phone = pending["phone"]
-        helios_id = pending["helios_id"]
-
         # Update member's verified status if DB available
         if self.db and helios_id:
             self._mark_member_verified(helios_id, phone)
 
-        # Cleanup
-        del self._pending_verifications[verification_id]
-
         return {
             "verified": True,
             "phone_masked": self._mask_phone(phone),
@@ -167,12 +295,8 @@ class HeliosSMS:
         if not self.available:
             return {"sent": False, "error": "SMS not configured"}
 
-        message = (
-            f"☀️ Helios Reward\n\n"
-            f"You earned {amount:.2f} HLS!\n"
-            f"Type: {reward_type}\n"
-            f"Account: {helios_id}\n\n"
-            f"View details in your dashboard."
+        message = _REWARD_TEMPLATE.format(
+            amount=amount, reward_type=reward_type, helios_id=helios_id
         )
 
         try:
@@ -187,13 +311,7 @@ class HeliosSMS:
         if not self.available:
             return {"sent": False, "error": "SMS not configured"}
 
-        alerts = {
-            "login": f"☀️ Security Alert\n\nNew login detected for {helios_id}.\nIf this wasn't you, recover your account immediately.",
-            "recovery": f"☀️ Security Alert\n\nAccount recovery initiated for {helios_id}.\nIf this wasn't you, contact support immediately.",
-            "large_transfer": f"☀️ Security Alert\n\nA large transfer was made from {helios_id}.\nIf this wasn't you, recover your account immediately."
-        }
-
-        message = alerts.get(alert_type, f"☀️ Security Alert for {helios_id}")
+        message = _ALERT_TEMPLATES.get(alert_type, _DEFAULT_ALERT).format(helios_id=helios_id)
 
         try:
             result = self._send_sms(phone, message)
@@ -216,24 +334,32 @@ class HeliosSMS:
             "from_number": self._mask_phone(self.from_number) if self.from_number else "not_set",
             "verify_expiry_minutes": self.expiry_minutes,
             "max_attempts": self.max_attempts,
-            "pending_verifications": len(self._pending_verifications)
+            "verification_store": "redis" if self.redis else "memory",
+            "pending_verifications": self._count_pending()
         }
 
+        cache = HeliosSMS._balance_cache
+        with HeliosSMS._balance_lock:
+            if cache["data"] and time.monotonic() - cache["ts"] < self.BALANCE_CACHE_TTL:
+                result.update(cache["data"])
+                return result
+
         # Try to ping Telnyx API
         try:
-            import requests
-            response = requests.get(
+            response = _get_client().get(
                 "https://api.telnyx.com/v2/balance",
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
                 timeout=10
             )
             if response.status_code == 200:
                 data = response.json().get("data", {})
-                result["balance"] = data.get("balance")
-                result["currency"] = data.get("currency")
+                balance = {
+                    "balance": data.get("balance"),
+                    "currency": data.get("currency")
+                }
+                with HeliosSMS._balance_lock:
+                    cache["data"] = balance
+                    cache["ts"] = time.monotonic()
+                result.update(balance)
             else:
                 result["api_status"] = "auth_error"
         except Exception as e:
@@ -245,25 +371,71 @@ class HeliosSMS:
 
     def _send_sms(self, to: str, text: str) -> dict:
         """Send an SMS message via Telnyx API."""
-        import requests
-
-        url = "https://api.telnyx.com/v2/messages"
+        response = _get_client().post(
+            _TELNYX_MESSAGES_URL, json=self._sms_payload(to, text)
+        )
+        response.raise_for_status()
+        return self._parse_send_response(response.json())
 
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+    async def send_bulk(self, messages: list) -> list:
+        """
+        Send many (phone, text) messages concurrently over one HTTP/2 client.
+        At most TELNYX_SENDS_PER_SECOND requests are in flight, and request
+        starts are paced to that rate to respect the Telnyx throughput cap.
+        Returns one result dict per message, in input order.
+        """
+        if not self.available:
+            return [{"to": to, "sent": False, "error": "SMS not configured"}
+                    for to, _ in messages]
+
+        import httpx
+
+        rate = HeliosConfig.TELNYX_SENDS_PER_SECOND
+        in_flight = asyncio.Semaphore(rate)
+        pacing = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        next_start = loop.time()
+
+        async def send_one(client, to, text):
+            nonlocal next_start
+            async with in_flight:
+                async with pacing:
+                    delay = next_start - loop.time()
+                    next_start = max(next_start, loop.time()) + 1 / rate
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                try:
+                    response = await client.post(
+                        _TELNYX_MESSAGES_URL, json=self._sms_payload(to, text)
+                    )
+                    response.raise_for_status()
+                    return {"to": to, "sent": True,
+                            **self._parse_send_response(response.json())}
+                except Exception as e:
+                    return {"to": to, "sent": False, "error": str(e)}
+
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=15,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json"
+            }
+        ) as client:
+            return await asyncio.gather(
+                *(send_one(client, to, text) for to, text in messages)
+            )
 
-        payload = {
+    def _sms_payload(self, to: str, text: str) -> dict:
+        return {
             "from": self.from_number,
             "to": to,
             "text": text
         }
 
-        response = requests.post(url, json=payload, headers=headers, timeout=15)
-        response.raise_for_status()
-
-        data = response.json().get("data", {})
+    @staticmethod
+    def _parse_send_response(body: dict) -> dict:
+        data = body.get("data", {})
         return {
             "message_id": data.get("id"),
             "status": data.get("to", [{}])[0].get("status", "queued") if isinstance(data.get("to"), list) else "sent"
@@ -273,9 +445,14 @@ class HeliosSMS:
 
     def _normalize_phone(self, phone: str) -> str:
         """Normalize phone number to E.164 format."""
-        import re
+        # Fast path: already E.164
+        if phone.startswith('+') and len(phone) >= 11 and phone[1:].isdecimal():
+            return phone
+
         # Strip all non-digit characters except leading +
-        cleaned = re.sub(r'[^\d+]', '', phone)
+        cleaned = phone.translate(_PHONE_DELETE)
+        if not cleaned.isascii():
+            cleaned = _PHONE_STRIP.sub('', cleaned)
 
         if cleaned.startswith('+'):
             return cleaned if len(cleaned) >= 11 else None
@@ -290,16 +467,121 @@ class HeliosSMS:
         """Mask phone number for display: +1***555****1234"""
         if not phone or len(phone) < 6:
             return "***"
-        return phone[:3] + "*" * (len(phone) - 7) + phone[-4:]
+        mask = _MASK_BY_LEN.get(len(phone))
+        if mask is None:
+            mask = "*" * (len(phone) - 7)
+        return phone[:3] + mask + phone[-4:]
 
     def _is_rate_limited(self, phone: str) -> bool:
-        """Check if a phone number has too many recent verification attempts."""
-        one_hour_ago = time.time() - 3600
-        recent_count = sum(
-            1 for v in self._pending_verifications.values()
-            if v["phone"] == phone and v["created_at"] > one_hour_ago
-        )
-        return recent_count >= 3
+        """
+        Token bucket per phone: RATE_LIMIT_CODES codes, refilled evenly over
+        RATE_LIMIT_WINDOW. Consumes a token when the send is allowed.
+        """
+        capacity = self.RATE_LIMIT_CODES
+        rate = capacity / self.RATE_LIMIT_WINDOW
+
+        if self.redis:
+            allowed = _rate_limit_script(
+                keys=[_BUCKET_KEY.format(phone)],
+                args=[capacity, rate, time.time(), self.RATE_LIMIT_WINDOW]
+            )
+            return not allowed
+
+        buckets = HeliosSMS._phone_buckets
+
+        # Request threads share the buckets: refill, spend and sweep as one step
+        with HeliosSMS._bucket_lock:
+            now = time.monotonic()
+            HeliosSMS._bucket_checks += 1
+            if HeliosSMS._bucket_checks % 1000 == 0:
+                self._sweep_buckets(now)
+
+            bucket = buckets.get(phone)
+            if bucket is None:
+                buckets[phone] = [capacity - 1, now]
+                return False
+
+            tokens, last = bucket
+            tokens = min(capacity, tokens + (now - last) * rate)
+            bucket[1] = now
+            if tokens < 1:
+                bucket[0] = tokens
+                return True
+            bucket[0] = tokens - 1
+            return False
+
+    def _sweep_buckets(self, now: float):
+        """Drop buckets that have been idle long enough to be full again. Caller holds _bucket_lock."""
+        buckets = HeliosSMS._phone_buckets
+        idle = [phone for phone, (_, last) in buckets.items()
+                if now - last > self.RATE_LIMIT_WINDOW]
+        for phone in idle:
+            buckets.pop(phone, None)
+
+    # ─── Verification Store (Redis when configured, else in-process) ───
+
+    def _store_verification(self, verification_id: str, entry: dict):
+        """Persist a pending verification; Redis expires it with the code."""
+        if self.redis:
+            key = _VERIFY_KEY.format(verification_id)
+            self.redis.hset(key, mapping={**entry, "helios_id": entry["helios_id"] or ""})
+            self.redis.expire(key, self.expiry_minutes * 60)
+        else:
+            with self._pending_lock:
+                self._pending_verifications[verification_id] = entry
+                self._expire_pending(entry["created_at"])
+
+    def _expire_pending(self, now: float):
+        """Drop expired in-process verifications from the head of the queue."""
+        pending = self._pending_verifications
+        cutoff = now - self.expiry_minutes * 60
+        while pending:
+            entry = next(iter(pending.values()))
+            if entry["created_at"] >= cutoff:
+                break
+            pending.popitem(last=False)
+
+    def _check_code(self, verification_id: str, code_hash: bytes) -> tuple:
+        """
+        Expiry, attempt count and hash compare as one atomic step.
+        Returns (status, attempts_remaining, phone, helios_id) where status is
+        missing | expired | too_many | wrong | ok. Expired, exhausted and
+        matched verifications are consumed.
+        """
+        if self.redis:
+            status, remaining, phone, helios_id = _verify_script(
+                keys=[_VERIFY_KEY.format(verification_id)],
+                args=[code_hash, time.time(), self.expiry_minutes * 60, self.max_attempts]
+            )
+            return status.decode(), remaining, phone.decode(), helios_id.decode() or None
+
+        with self._pending_lock:
+            pending = self._pending_verifications.get(verification_id)
+            if not pending:
+                return "missing", 0, None, None
+            if time.time() - pending["created_at"] > self.expiry_minutes * 60:
+                del self._pending_verifications[verification_id]
+                return "expired", 0, None, None
+            pending["attempts"] += 1
+            if pending["attempts"] > self.max_attempts:
+                del self._pending_verifications[verification_id]
+                return "too_many", 0, None, None
+            if not hmac.compare_digest(code_hash, pending["code"]):
+                return "wrong", self.max_attempts - pending["attempts"], None, None
+            del self._pending_verifications[verification_id]
+            return "ok", 0, pending["phone"], pending["helios_id"]
+
+    def _delete_verification(self, verification_id: str):
+        if self.redis:
+            self.redis.delete(_VERIFY_KEY.format(verification_id))
+        else:
+            with self._pending_lock:
+                self._pending_verifications.pop(verification_id, None)
+
+    def _count_pending(self) -> int:
+        if self.redis:
+            return sum(1 for _ in self.redis.scan_iter(match=_VERIFY_KEY.format("*"), count=500))
+        return len(self._pending_verifications)
 
     def _mark_member_verified(self, helios_id: str, phone: str):
         """Mark a member as phone-verified in the database."""
@@ -7,10 +7,37 @@ Events are ticketed or free. Platform take on revenue.
 
 import uuid
 from datetime import datetime, timezone
+from sqlalchemy import insert, select, exists, literal, tuple_
 from config import HeliosConfig
+from core.pagination import page_limit, encode_cursor, decode_cursor
 from models.space import Space, SpaceEvent
 from models.credential import Credential
 
+# List views read plain columns — same keys as to_dict(), no ORM hydration
+_SPACE_LIST_FIELDS = (
+    "space_id", "name", "description", "owner_id", "is_public", "max_members",
+    "room_count", "entry_fee_usd", "member_count", "is_active", "created_at",
+)
+_EVENT_LIST_FIELDS = (
+    "event_id", "space_id", "host_id", "title", "description", "event_type",
+    "ticket_price_usd", "max_attendees", "attendee_count", "starts_at",
+    "ends_at", "is_active",
+)
+_SPACE_LIST_COLS = tuple(getattr(Space, f) for f in _SPACE_LIST_FIELDS)
+# created_at (events) and id trail the listed fields: needed for the cursor, not returned
+_SPACE_PAGE_COLS = _SPACE_LIST_COLS + (Space.id,)
+_EVENT_LIST_COLS = tuple(
+    getattr(SpaceEvent, f) for f in _EVENT_LIST_FIELDS
+) + (SpaceEvent.created_at, SpaceEvent.id)
+
+
+def _row_dict(fields: tuple, row) -> dict:
+    """Column tuple → to_dict()-shaped dict (datetimes as ISO strings)."""
+    return {
+        k: v.isoformat() if isinstance(v, datetime) else v
+        for k, v in zip(fields, row)
+    }
+
 
 class SpaceEngine:
     """Community spaces with rooms and events."""
@@ -24,32 +51,35 @@ class SpaceEngine:
         """
         Create a new space. Owner must hold an operator or host credential.
         """
-        # Verify credential
-        cred = self.db.query(Credential).filter(
+        space_id = f"SP-{uuid.uuid4().hex[:12].upper()}"
+
+        # Credential check + insert in one statement:
+        # INSERT ... SELECT ... WHERE EXISTS (credential) RETURNING
+        has_credential = exists().where(
             Credential.holder_id == owner_id,
             Credential.credential_type.in_(["operator", "host"]),
             Credential.is_active == True
-        ).first()
-
-        if not cred:
-            raise ValueError(f"Node {owner_id} does not hold an active operator or host credential")
-
-        space_id = f"SP-{uuid.uuid4().hex[:12].upper()}"
-
-        space = Space(
-            space_id=space_id,
-            name=name,
-            description=description,
-            owner_id=owner_id,
-            is_public=is_public,
-            max_members=max_members,
-            entry_fee_usd=entry_fee_usd
         )
-
-        self.db.add(space)
+        values = {
+            "space_id": space_id,
+            "name": name,
+            "description": description,
+            "owner_id": owner_id,
+            "is_public": is_public,
+            "max_members": max_members,
+            "entry_fee_usd": entry_fee_usd,
+        }
+        stmt = insert(Space).from_select(
+            list(values),
+            select(*(literal(v) for v in values.values())).where(has_credential)
+        ).returning(*_SPACE_LIST_COLS)
+
+        row = self.db.execute(stmt).first()
+        if row is None:
+            raise ValueError(f"Node {owner_id} does not hold an active operator or host credential")
         self.db.commit()
 
-        return space.to_dict()
+        return _row_dict(_SPACE_LIST_FIELDS, row)
 
     def create_event(self, space_id: str, host_id: str, title: str,
                      description: str = None, event_type: str = "general",
@@ -82,17 +112,27 @@ class SpaceEngine:
         )
 
         self.db.add(event)
-        space.room_count += 1
+        # Incremented in SQL (room_count = room_count + 1) — no lost updates
+        space.room_count = Space.room_count + 1
         self.db.commit()
 
         return event.to_dict()
 
-    def list_spaces(self, is_public: bool = None, limit: int = 50) -> list:
-        """List spaces with optional filters."""
-        query = self.db.query(Space).filter_by(is_active=True)
+    def list_spaces(self, is_public: bool = None, cursor: str = None,
+                    limit: int = 50) -> dict:
+        """
+        List active spaces, newest first.
+        Keyset-paginated: pass the previous page's next_cursor to continue.
+        """
+        limit = page_limit(limit)
+        position = decode_cursor(cursor)
+        query = self.db.query(*_SPACE_PAGE_COLS).filter(Space.is_active == True)
         if is_public is not None:
-            query = query.filter_by(is_public=is_public)
-        return [s.to_dict() for s in query.order_by(Space.created_at.desc()).limit(limit).all()]
+            query = query.filter(Space.is_public == is_public)
+        if position is not None:
+            query = query.filter(tuple_(Space.created_at, Space.id) < position)
+        rows = query.order_by(Space.created_at.desc(), Space.id.desc()).limit(limit).all()
+        return self._page(rows, _SPACE_LIST_FIELDS, limit)
 
     def get_space(self, space_id: str) -> dict:
         """Get space details."""
@@ -101,9 +141,29 @@ class SpaceEngine:
             raise ValueError(f"Space {space_id} not found")
         return space.to_dict()
 
-    def list_events(self, space_id: str = None, limit: int = 50) -> list:
-        """List events, optionally filtered by space."""
-        query = self.db.query(SpaceEvent).filter_by(is_active=True)
+    def list_events(self, space_id: str = None, cursor: str = None,
+                    limit: int = 50) -> dict:
+        """
+        List active events, newest first, optionally filtered by space.
+        Keyset-paginated: pass the previous page's next_cursor to continue.
+        """
+        limit = page_limit(limit)
+        position = decode_cursor(cursor)
+        query = self.db.query(*_EVENT_LIST_COLS).filter(SpaceEvent.is_active == True)
         if space_id:
-            query = query.filter_by(space_id=space_id)
-        return [e.to_dict() for e in query.order_by(SpaceEvent.created_at.desc()).limit(limit).all()]
+            query = query.filter(SpaceEvent.space_id == space_id)
+        if position is not None:
+            query = query.filter(tuple_(SpaceEvent.created_at, SpaceEvent.id) < position)
+        rows = query.order_by(SpaceEvent.created_at.desc(), SpaceEvent.id.desc()).limit(limit).all()
+        return self._page(rows, _EVENT_LIST_FIELDS, limit)
+
+    @staticmethod
+    def _page(rows: list, fields: tuple, limit: int) -> dict:
+        """Wrap a page of rows; next_cursor is None once the listing is exhausted."""
+        return {
+            "items": [_row_dict(fields, row) for row in rows],
+            "next_cursor": (
+                encode_cursor(rows[-1].created_at, rows[-1].id)
+                if len(rows) == limit and rows[-1].created_at else None
+            ),
+        }
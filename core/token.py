@@ -9,6 +9,27 @@ from datetime import datetime, timezone, timedelta
 from decimal import Decimal, ROUND_DOWN
 from config import HeliosConfig
 
+# Founder lock window, fixed once per process rather than re-derived per call
+_FOUNDER_LOCK_END = datetime.now(timezone.utc) + timedelta(
+    days=HeliosConfig.TOKEN_FOUNDER_LOCK_YEARS * 365
+)
+
+# Vesting/lock windows measured from genesis
+_DEV_UNLOCK = timedelta(days=4 * 365)
+_RES_UNLOCK = timedelta(days=5 * 365)
+
+# Pool allocations in smallest units (supply × 10^decimals), exact integer math
+_UNIT = 10 ** HeliosConfig.TOKEN_DECIMALS
+_POOL_UNITS = {
+    name: HeliosConfig.TOKEN_TOTAL_SUPPLY * _UNIT * percent // 100
+    for name, percent in (
+        ("reward_pool", HeliosConfig.TOKEN_POOL_LOCK_PERCENT),
+        ("circulation", HeliosConfig.TOKEN_CIRCULATION_PERCENT),
+        ("development", HeliosConfig.TOKEN_DEVELOPMENT_PERCENT),
+        ("reserve", HeliosConfig.TOKEN_RESERVE_PERCENT),
+    )
+}
+
 
 class TokenEngine:
     """
@@ -20,6 +41,10 @@ class TokenEngine:
     - All movements are recorded
     """
 
+    # Built on first request — every input is a protocol constant
+    _info_cache = None
+    _founder_lock_cache = None
+
     def __init__(self, db_session):
         self.db = db_session
         self._supply = Decimal(str(HeliosConfig.TOKEN_TOTAL_SUPPLY))
@@ -28,7 +53,15 @@ class TokenEngine:
     # ─── Token Info (Public) ──────────────────────────────────────────
 
     def get_token_info(self) -> dict:
-        """Public token information — verifiable by anyone."""
+        """
+        Public token information — verifiable by anyone.
+        Built once from protocol constants; the returned dict is shared.
+        """
+        if TokenEngine._info_cache is None:
+            TokenEngine._info_cache = self._build_token_info()
+        return TokenEngine._info_cache
+
+    def _build_token_info(self) -> dict:
         return {
             "name": HeliosConfig.TOKEN_NAME,
             "symbol": HeliosConfig.TOKEN_SYMBOL,
@@ -37,24 +70,24 @@ class TokenEngine:
             "allocation": {
                 "reward_pool": {
                     "percent": HeliosConfig.TOKEN_POOL_LOCK_PERCENT,
-                    "amount": float(self._supply * HeliosConfig.TOKEN_POOL_LOCK_PERCENT / 100),
+                    "amount": _POOL_UNITS["reward_pool"] / _UNIT,
                     "status": "locked",
                     "lock_type": "smart_contract"
                 },
                 "circulation": {
                     "percent": HeliosConfig.TOKEN_CIRCULATION_PERCENT,
-                    "amount": float(self._supply * HeliosConfig.TOKEN_CIRCULATION_PERCENT / 100),
+                    "amount": _POOL_UNITS["circulation"] / _UNIT,
                     "status": "distributing"
                 },
                 "development": {
                     "percent": HeliosConfig.TOKEN_DEVELOPMENT_PERCENT,
-                    "amount": float(self._supply * HeliosConfig.TOKEN_DEVELOPMENT_PERCENT / 100),
+                    "amount": _POOL_UNITS["development"] / _UNIT,
                     "status": "vesting",
                     "vesting_years": 4
                 },
                 "reserve": {
                     "percent": HeliosConfig.TOKEN_RESERVE_PERCENT,
-                    "amount": float(self._supply * HeliosConfig.TOKEN_RESERVE_PERCENT / 100),
+                    "amount": _POOL_UNITS["reserve"] / _UNIT,
                     "status": "locked",
                     "lock_years": 5
                 }
@@ -71,31 +104,24 @@ class TokenEngine:
     def get_supply_stats(self) -> dict:
         """Real-time supply statistics."""
         from models.reward import Reward
-        from sqlalchemy import func
-
-        # Calculate circulating supply from actual distributions
-        distributed = self.db.query(
-            func.sum(Reward.amount)
-        ).filter(
-            Reward.status == "settled",
-            Reward.member_id != "POOL"
-        ).scalar() or Decimal('0')
+        from sqlalchemy import func, case
 
-        pool_balance = self.db.query(
-            func.sum(Reward.amount)
+        # Circulating vs pool supply in one pass over settled rewards
+        distributed, pool_balance = self.db.query(
+            func.sum(case((Reward.member_id != "POOL", Reward.amount), else_=0)),
+            func.sum(case((Reward.member_id == "POOL", Reward.amount), else_=0))
         ).filter(
-            Reward.status == "settled",
-            Reward.member_id == "POOL"
-        ).scalar() or Decimal('0')
+            Reward.status == "settled"
+        ).one()
 
-        pool_max = self._supply * HeliosConfig.TOKEN_POOL_LOCK_PERCENT / 100
-        circulating = Decimal(str(distributed))
+        circulating = Decimal(str(distributed or 0))
+        pool_balance = Decimal(str(pool_balance or 0))
 
         return {
             "total_supply": float(self._supply),
             "circulating": float(circulating),
             "in_pool": float(pool_balance),
-            "pool_max": float(pool_max),
+            "pool_max": _POOL_UNITS["reward_pool"] / _UNIT,
             "locked": float(self._supply - circulating - pool_balance),
             "burn_total": 0,  # No burns yet
             "percent_circulating": round(
@@ -116,39 +142,24 @@ class TokenEngine:
         if existing:
             raise ValueError("Pools already initialized. Cannot re-initialize.")
 
+        now = datetime.now(timezone.utc)
         pools = []
         allocations = {
-            "reward_pool": (
-                HeliosConfig.TOKEN_POOL_LOCK_PERCENT,
-                "locked",
-                None
-            ),
-            "circulation": (
-                HeliosConfig.TOKEN_CIRCULATION_PERCENT,
-                "active",
-                None
-            ),
-            "development": (
-                HeliosConfig.TOKEN_DEVELOPMENT_PERCENT,
-                "vesting",
-                datetime.now(timezone.utc) + timedelta(days=4 * 365)
-            ),
-            "reserve": (
-                HeliosConfig.TOKEN_RESERVE_PERCENT,
-                "locked",
-                datetime.now(timezone.utc) + timedelta(days=5 * 365)
-            ),
+            "reward_pool": ("locked", None),
+            "circulation": ("active", None),
+            "development": ("vesting", now + _DEV_UNLOCK),
+            "reserve": ("locked", now + _RES_UNLOCK),
         }
 
-        for name, (percent, status, unlock_date) in allocations.items():
-            amount = float(self._supply * percent / 100)
+        for name, (status, unlock_date) in allocations.items():
+            amount = _POOL_UNITS[name] / _UNIT
             pool = TokenPool(
                 name=name,
                 amount=amount,
                 initial_amount=amount,
                 status=status,
                 unlock_date=unlock_date,
-                created_at=datetime.now(timezone.utc)
+                created_at=now
             )
             self.db.add(pool)
             pools.append({
@@ -163,28 +174,38 @@ class TokenEngine:
             "initialized": True,
             "pools": pools,
             "total_supply": float(self._supply),
-            "genesis_time": datetime.now(timezone.utc).isoformat()
+            "genesis_time": now.isoformat()
         }
 
     def get_pool_balances(self) -> dict:
         """Current balance of each pool."""
         from models.token_pool import TokenPool
+        from sqlalchemy import case, and_, or_
 
-        pools = self.db.query(TokenPool).all()
-        result = {}
-        for pool in pools:
-            is_unlocked = (
-                pool.unlock_date is not None and
-                datetime.now(timezone.utc) >= pool.unlock_date
-            )
-            result[pool.name] = {
-                "balance": pool.amount,
-                "initial": pool.initial_amount,
-                "status": pool.status,
-                "locked": not is_unlocked and pool.status in ("locked", "vesting"),
-                "unlock_date": pool.unlock_date.isoformat() if pool.unlock_date else None
+        # Unlock dates are stored naive UTC; bind now the same way
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        locked = case(
+            (and_(
+                TokenPool.status.in_(("locked", "vesting")),
+                or_(TokenPool.unlock_date.is_(None), TokenPool.unlock_date > now)
+            ), True),
+            else_=False
+        )
+
+        rows = self.db.query(
+            TokenPool.name, TokenPool.amount, TokenPool.initial_amount,
+            TokenPool.status, TokenPool.unlock_date, locked
+        ).all()
+        return {
+            name: {
+                "balance": amount,
+                "initial": initial,
+                "status": status,
+                "locked": bool(is_locked),
+                "unlock_date": unlock_date.isoformat() if unlock_date else None
             }
-        return result
+            for name, amount, initial, status, unlock_date, is_locked in rows
+        }
 
     # ─── Anti-Rug Verification ────────────────────────────────────────
 
@@ -195,17 +216,17 @@ class TokenEngine:
         """
         from models.token_pool import TokenPool
         from models.reward import Reward
-        from sqlalchemy import func
+        from sqlalchemy import func, select
 
-        # Sum all pool balances
-        pool_total = self.db.query(
-            func.sum(TokenPool.amount)
-        ).scalar() or Decimal('0')
-
-        # Sum all distributed rewards
-        distributed = self.db.query(
-            func.sum(Reward.amount)
-        ).filter(Reward.status == "settled").scalar() or Decimal('0')
+        # Pool balances + distributed rewards, one round-trip
+        pool_total, distributed = self.db.query(
+            select(func.sum(TokenPool.amount)).scalar_subquery(),
+            select(func.sum(Reward.amount)).where(
+                Reward.status == "settled"
+            ).scalar_subquery()
+        ).one()
+        pool_total = pool_total or Decimal('0')
+        distributed = distributed or Decimal('0')
 
         accounted = Decimal(str(pool_total)) + Decimal(str(distributed))
         expected = self._supply
@@ -231,17 +252,17 @@ class TokenEngine:
 
     def check_founder_lock(self) -> dict:
         """Check if founder tokens are still locked."""
-        lock_end = datetime.now(timezone.utc) + timedelta(
-            days=HeliosConfig.TOKEN_FOUNDER_LOCK_YEARS * 365
-        )
-        locked = datetime.now(timezone.utc) < lock_end
+        if TokenEngine._founder_lock_cache is None:
+            TokenEngine._founder_lock_cache = {
+                "lock_years": HeliosConfig.TOKEN_FOUNDER_LOCK_YEARS,
+                "lock_ends": _FOUNDER_LOCK_END.isoformat(),
+                "message": (
+                    f"Founder tokens locked for {HeliosConfig.TOKEN_FOUNDER_LOCK_YEARS} years. "
+                    "Nobody can access them early."
+                )
+            }
 
         return {
-            "founder_tokens_locked": locked,
-            "lock_years": HeliosConfig.TOKEN_FOUNDER_LOCK_YEARS,
-            "lock_ends": lock_end.isoformat(),
-            "message": (
-                f"Founder tokens locked for {HeliosConfig.TOKEN_FOUNDER_LOCK_YEARS} years. "
-                "Nobody can access them early."
-            )
+            "founder_tokens_locked": datetime.now(timezone.utc) < _FOUNDER_LOCK_END,
+            **TokenEngine._founder_lock_cache
         }
@@ -11,7 +11,7 @@ Manages:
 - Evidence bundle management (IPFS CIDs)
 """
 
-import uuid
+import secrets
 import hashlib
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -19,6 +19,20 @@ from config import HeliosConfig
 from models.vault_receipt import VaultReceipt
 from models.energy_event import EnergyEvent
 
+# Validation sets — error messages still show the ordered config lists
+_DEALERS = frozenset(HeliosConfig.TREASURY_DEALERS)
+_METALS = frozenset(HeliosConfig.METAL_TYPES)
+_CUSTODY = frozenset(HeliosConfig.CUSTODY_STATES)
+
+# Receipt listings read to_dict()'s columns directly — no ORM hydration
+_MVR_LIST_FIELDS = (
+    "mvr_id", "dealer", "invoice_id", "purchase_date", "metal", "form",
+    "purity", "weight_oz", "quantity", "unit_cost_usd", "total_cost_usd",
+    "serials", "custody_status", "evidence_bundle_cid",
+    "sha256_evidence_bundle", "xrpl_tx_hash", "policy_version", "created_at",
+)
+_MVR_LIST_COLS = tuple(getattr(VaultReceipt, f) for f in _MVR_LIST_FIELDS)
+
 
 class TreasuryEngine:
     """The metal spine. Every ounce is accounted for."""
@@ -36,14 +50,14 @@ class TreasuryEngine:
         """
         Mint a new Metal Vault Receipt. Atomic — either fully created or not.
         """
-        if dealer not in HeliosConfig.TREASURY_DEALERS:
+        if dealer not in _DEALERS:
             raise ValueError(f"Dealer '{dealer}' not in approved list: {HeliosConfig.TREASURY_DEALERS}")
 
-        if metal not in HeliosConfig.METAL_TYPES:
+        if metal not in _METALS:
             raise ValueError(f"Metal '{metal}' not recognized. Valid: {HeliosConfig.METAL_TYPES}")
 
         total_cost = unit_cost_usd * quantity
-        mvr_id = f"MVR-{uuid.uuid4().hex[:12].upper()}"
+        mvr_id = f"MVR-{secrets.token_hex(6).upper()}"
 
         mvr = VaultReceipt(
             mvr_id=mvr_id,
@@ -71,36 +85,40 @@ class TreasuryEngine:
 
     def update_custody(self, mvr_id: str, new_status: str, notes: str = None) -> dict:
         """Update custody status of a vault receipt."""
-        if new_status not in HeliosConfig.CUSTODY_STATES:
+        if new_status not in _CUSTODY:
             raise ValueError(f"Invalid custody status: {new_status}")
 
-        mvr = self.db.query(VaultReceipt).filter_by(mvr_id=mvr_id).first()
-        if not mvr:
-            raise ValueError(f"MVR {mvr_id} not found")
+        now = datetime.now(timezone.utc)
 
-        mvr.custody_status = new_status
+        # Single UPDATE — no SELECT, no row hydration
+        changes = {VaultReceipt.custody_status: new_status}
         if new_status == HeliosConfig.CUSTODY_DELIVERED:
-            mvr.delivered_at = datetime.now(timezone.utc)
+            changes[VaultReceipt.delivered_at] = now
 
+        updated = self.db.query(VaultReceipt).filter_by(mvr_id=mvr_id).update(
+            changes, synchronize_session=False
+        )
+        if not updated:
+            raise ValueError(f"MVR {mvr_id} not found")
         self.db.commit()
 
         return {
             "mvr_id": mvr_id,
             "custody_status": new_status,
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "updated_at": now.isoformat()
         }
 
     def anchor_to_xrpl(self, mvr_id: str, tx_hash: str,
                         issuer_wallet: str = None,
                         attestation_wallet: str = None) -> dict:
         """Record XRPL anchoring transaction for an MVR."""
-        mvr = self.db.query(VaultReceipt).filter_by(mvr_id=mvr_id).first()
-        if not mvr:
+        updated = self.db.query(VaultReceipt).filter_by(mvr_id=mvr_id).update({
+            VaultReceipt.xrpl_tx_hash: tx_hash,
+            VaultReceipt.issuer_wallet: issuer_wallet or HeliosConfig.XRPL_WALLET_ADDRESS,
+            VaultReceipt.attestation_wallet: attestation_wallet,
+        }, synchronize_session=False)
+        if not updated:
             raise ValueError(f"MVR {mvr_id} not found")
-
-        mvr.xrpl_tx_hash = tx_hash
-        mvr.issuer_wallet = issuer_wallet or HeliosConfig.XRPL_WALLET_ADDRESS
-        mvr.attestation_wallet = attestation_wallet
         self.db.commit()
 
         return {
@@ -137,29 +155,36 @@ class TreasuryEngine:
         Public proof-of-reserves. Anyone can verify.
         Returns total metal holdings by type, total cost, anchored count.
         """
-        receipts = self.db.query(VaultReceipt).all()
+        from sqlalchemy import func, case
+
+        # One grouped aggregate per metal; grand totals fold the few result rows
+        rows = self.db.query(
+            VaultReceipt.metal,
+            func.sum(VaultReceipt.weight_oz * VaultReceipt.quantity),
+            func.sum(VaultReceipt.total_cost_usd),
+            func.count(VaultReceipt.id),
+            func.sum(case(
+                (func.coalesce(VaultReceipt.xrpl_tx_hash, "") != "", 1), else_=0
+            ))
+        ).group_by(VaultReceipt.metal).all()
 
         by_metal = {}
         total_cost = 0.0
         total_oz = 0.0
+        total_receipts = 0
         anchored = 0
 
-        for r in receipts:
-            metal = r.metal
-            if metal not in by_metal:
-                by_metal[metal] = {"total_oz": 0.0, "total_cost_usd": 0.0, "count": 0}
-            by_metal[metal]["total_oz"] += r.total_oz
-            by_metal[metal]["total_cost_usd"] += r.total_cost_usd
-            by_metal[metal]["count"] += 1
-            total_cost += r.total_cost_usd
-            total_oz += r.total_oz
-            if r.is_anchored:
-                anchored += 1
+        for metal, metal_oz, metal_cost, count, metal_anchored in rows:
+            by_metal[metal] = {"total_oz": metal_oz, "total_cost_usd": metal_cost, "count": count}
+            total_cost += metal_cost
+            total_oz += metal_oz
+            total_receipts += count
+            anchored += metal_anchored
 
         return {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "policy_version": HeliosConfig.TREASURY_POLICY_VERSION,
-            "total_receipts": len(receipts),
+            "total_receipts": total_receipts,
             "total_cost_usd": round(total_cost, 2),
             "total_oz": round(total_oz, 4),
             "anchored_on_xrpl": anchored,
@@ -178,12 +203,41 @@ class TreasuryEngine:
 
     def list_vault_receipts(self, metal: str = None,
                              custody_status: str = None,
-                             limit: int = 50) -> list:
-        """List vault receipts with optional filters."""
-        query = self.db.query(VaultReceipt)
+                             cursor: str = None,
+                             limit: int = 50) -> dict:
+        """
+        List vault receipts with optional filters.
+        Keyset-paginated: pass the previous page's next_cursor as cursor.
+        """
+        from sqlalchemy import select, tuple_
+        from core.pagination import page_limit, encode_cursor, decode_cursor
+
+        limit = page_limit(limit)
+        position = decode_cursor(cursor)
+
+        stmt = select(*_MVR_LIST_COLS, VaultReceipt.id)
         if metal:
-            query = query.filter_by(metal=metal)
+            stmt = stmt.where(VaultReceipt.metal == metal)
         if custody_status:
-            query = query.filter_by(custody_status=custody_status)
-        query = query.order_by(VaultReceipt.created_at.desc()).limit(limit)
-        return [r.to_dict() for r in query.all()]
+            stmt = stmt.where(VaultReceipt.custody_status == custody_status)
+        if position is not None:
+            # (created_at, id) so receipts sharing a timestamp aren't skipped
+            stmt = stmt.where(tuple_(VaultReceipt.created_at, VaultReceipt.id) < position)
+        stmt = stmt.order_by(VaultReceipt.created_at.desc(), VaultReceipt.id.desc()).limit(limit)
+
+        receipts = []
+        last = None
+        for row in self.db.execute(stmt).yield_per(200):
+            last = row
+            receipt = dict(zip(_MVR_LIST_FIELDS, row))
+            for key in ("purchase_date", "created_at"):
+                if receipt[key]:
+                    receipt[key] = receipt[key].isoformat()
+            receipts.append(receipt)
+        return {
+            "items": receipts,
+            "next_cursor": (
+                encode_cursor(last.created_at, last.id)
+                if len(receipts) == limit else None
+            ),
+        }
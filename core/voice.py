@@ -9,9 +9,39 @@ import io
 import base64
 import hashlib
 import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from config import HeliosConfig, BASE_DIR
 
+try:
+    import blake3
+except ImportError:  # Optional accelerator — cache keys fall back to SHA-256
+    blake3 = None
+
+# Speech cleanup patterns — compiled once
+_RE_BULLET = re.compile(r'[•\-\*]\s*')
+_RE_NUMLIST = re.compile(r'^\d+\.\s*', re.MULTILINE)
+_RE_PARA = re.compile(r'\n{2,}')
+
+_session = None
+
+
+def _get_session():
+    """Pooled keep-alive session for ElevenLabs — TLS handshakes are reused."""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers["xi-api-key"] = HeliosConfig.ELEVENLABS_API_KEY
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        _session = session
+    return _session
+
 
 class HeliosVoice:
     """
@@ -22,6 +52,16 @@ class HeliosVoice:
 
     CACHE_DIR = Path(BASE_DIR) / "data" / "voice_cache"
 
+    # Hot phrases stay in memory as ready-to-send base64, in front of the disk cache.
+    # Shared across instances — routes build a HeliosVoice per request.
+    MEM_CACHE_SIZE = 128
+    _mem_cache = OrderedDict()
+    _mem_lock = threading.Lock()
+
+    # Clips are sharded into <key[:2]>/ subdirectories; flat files from
+    # older layouts are moved into their shards once per process.
+    _layout_checked = False
+
     def __init__(self):
         self.api_key = HeliosConfig.ELEVENLABS_API_KEY
         self.voice_id = HeliosConfig.ELEVENLABS_VOICE_ID
@@ -32,13 +72,18 @@ class HeliosVoice:
 
         # Ensure cache directory exists
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        if not HeliosVoice._layout_checked:
+            HeliosVoice._layout_checked = True
+            self._migrate_flat_cache()
 
     # ─── Main TTS ──────────────────────────────────────────────────────
 
-    def speak(self, text: str, use_cache: bool = True, voice_id: str = None) -> dict:
+    def speak(self, text: str, use_cache: bool = True, voice_id: str = None,
+              return_bytes: bool = False) -> dict:
         """
         Convert text to speech audio.
-        Returns base64-encoded MP3 audio data.
+        Returns base64-encoded MP3 audio data, or raw MP3 bytes when
+        return_bytes is set (for callers that can send binary directly).
         Optional voice_id overrides the default voice.
         """
         # Allow per-request voice override
@@ -53,6 +98,13 @@ class HeliosVoice:
                 "available": False
             }
 
+        # Raw-input key first — an exact repeat skips the cleaning pipeline
+        raw_key = self._cache_key(self._normalize_for_key(text)) if use_cache else None
+        if use_cache:
+            cached = self._lookup_cache(raw_key, return_bytes)
+            if cached:
+                return self._cached_result(cached, return_bytes)
+
         # Clean text for speech (strip markdown-like formatting)
         clean_text = self._clean_for_speech(text)
 
@@ -66,25 +118,34 @@ class HeliosVoice:
         # Check cache first
         cache_key = self._cache_key(clean_text)
         if use_cache:
-            cached = self._get_cached(cache_key)
+            cached = self._lookup_cache(cache_key, return_bytes)
             if cached:
+                self._alias_cache(raw_key, cache_key, None if return_bytes else cached)
+                return self._cached_result(cached, return_bytes)
+
+        # Call ElevenLabs API
+        try:
+            audio_data = self._call_elevenlabs(clean_text)
+
+            if return_bytes:
+                if use_cache and audio_data:
+                    self._save_cache(cache_key, audio_data)
+                    self._alias_cache(raw_key, cache_key)
                 return {
-                    "audio": cached,
+                    "audio": audio_data,
                     "format": "mp3",
-                    "source": "cache",
+                    "encoding": "bytes",
+                    "source": "elevenlabs",
                     "available": True
                 }
 
-        # Call ElevenLabs API
-        try:
-            audio_data = self._call_elevenlabs(clean_text)
+            # Return base64-encoded audio (memoryview skips a copy; base64 is ASCII)
+            audio_b64 = base64.b64encode(memoryview(audio_data)).decode("ascii")
 
             # Cache the result
             if use_cache and audio_data:
-                self._save_cache(cache_key, audio_data)
-
-            # Return base64-encoded audio
-            audio_b64 = base64.b64encode(audio_data).decode("utf-8")
+                self._save_cache(cache_key, audio_data, audio_b64)
+                self._alias_cache(raw_key, cache_key, audio_b64)
 
             return {
                 "audio": audio_b64,
@@ -106,11 +167,8 @@ class HeliosVoice:
             return {"voices": [], "error": "Voice service not configured"}
 
         try:
-            import requests
-
-            response = requests.get(
+            response = _get_session().get(
                 "https://api.elevenlabs.io/v1/voices",
-                headers={"xi-api-key": self.api_key},
                 timeout=10
             )
             response.raise_for_status()
@@ -144,11 +202,8 @@ class HeliosVoice:
             }
 
         try:
-            import requests
-
-            response = requests.get(
+            response = _get_session().get(
                 "https://api.elevenlabs.io/v1/user/subscription",
-                headers={"xi-api-key": self.api_key},
                 timeout=10
             )
             response.raise_for_status()
@@ -173,13 +228,10 @@ class HeliosVoice:
 
     def _call_elevenlabs(self, text: str) -> bytes:
         """Call the ElevenLabs TTS API and return raw audio bytes."""
-        import requests
-
         active_voice = getattr(self, '_override_voice', None) or self.voice_id
         url = f"https://api.elevenlabs.io/v1/text-to-speech/{active_voice}"
 
         headers = {
-            "xi-api-key": self.api_key,
             "Content-Type": "application/json",
             "Accept": "audio/mpeg"
         }
@@ -193,7 +245,7 @@ class HeliosVoice:
             }
         }
 
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _get_session().post(url, json=payload, headers=headers, timeout=30)
         response.raise_for_status()
 
         return response.content
@@ -202,20 +254,15 @@ class HeliosVoice:
 
     def _clean_for_speech(self, text: str) -> str:
         """Clean text for natural speech output."""
-        import re
-
-        # Remove bullet points and list markers
-        text = re.sub(r'[•\-\*]\s*', '', text)
-        # Remove markdown-style formatting
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-        text = re.sub(r'\*(.+?)\*', r'\1', text)
+        # Remove bullet points and list markers — this also drops every
+        # '*', so markdown bold/italic needs no pass of its own
+        text = _RE_BULLET.sub('', text)
         # Remove numbered list markers like "1." at start of lines
-        text = re.sub(r'^\d+\.\s*', '', text, flags=re.MULTILINE)
+        text = _RE_NUMLIST.sub('', text)
         # Collapse multiple newlines into pauses
-        text = re.sub(r'\n{2,}', '. ', text)
-        text = re.sub(r'\n', ' ', text)
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _RE_PARA.sub('. ', text)
+        # Single newlines and whitespace runs → one space (C-level split/join)
+        text = ' '.join(text.split())
 
         # Truncate to ElevenLabs limit (5000 chars)
         if len(text) > 4800:
@@ -225,29 +272,155 @@ class HeliosVoice:
 
     # ─── Cache Management ──────────────────────────────────────────────
 
+    @staticmethod
+    def _normalize_for_key(text: str) -> str:
+        """
+        Cheap raw-input key text. The trailing newline keeps raw keys apart
+        from cleaned-text keys — cleaned text never contains one.
+        """
+        return text.strip() + "\n"
+
+    def _lookup_cache(self, key: str, return_bytes: bool):
+        """Cached audio as raw bytes or base64, per the caller's encoding."""
+        return self._read_cache_file(key) if return_bytes else self._get_cached(key)
+
+    @staticmethod
+    def _cached_result(cached, return_bytes: bool) -> dict:
+        result = {
+            "audio": cached,
+            "format": "mp3",
+            "source": "cache",
+            "available": True
+        }
+        if return_bytes:
+            result["encoding"] = "bytes"
+        return result
+
+    def _alias_cache(self, raw_key: str, key: str, audio_b64: str = None):
+        """Point the raw-input key at the cleaned-text entry via hardlinks (no duplicate audio)."""
+        if raw_key is None or raw_key == key:
+            return
+        for ext in (".mp3", ".b64"):
+            try:
+                link = self._cache_path(raw_key, ext)
+                link.parent.mkdir(exist_ok=True)
+                os.link(self._cache_path(key, ext), link)
+            except OSError:
+                pass  # Missing, already linked, or links unsupported — the cleaned key still serves it
+        if audio_b64 is not None:
+            self._remember(raw_key, audio_b64)
+
     def _cache_key(self, text: str) -> str:
-        """Generate a cache key from text + voice settings."""
+        """Generate a cache key from text + voice settings (32 hex chars)."""
         active_voice = getattr(self, '_override_voice', None) or self.voice_id
-        content = f"{text}:{active_voice}:{self.model}"
-        return hashlib.md5(content.encode()).hexdigest()
+        content = f"{text}:{active_voice}:{self.model}:{self.stability}:{self.similarity}".encode()
+        if blake3 is not None:
+            return blake3.blake3(content).hexdigest(length=16)
+        return hashlib.sha256(content).hexdigest()[:32]
+
+    def _cache_path(self, key: str, ext: str = ".mp3") -> Path:
+        """On-disk location of a cache entry, sharded by the first two hex chars of its key."""
+        return self.CACHE_DIR / key[:2] / f"{key}{ext}"
 
     def _get_cached(self, key: str) -> str:
-        """Retrieve cached audio as base64 string."""
-        cache_file = self.CACHE_DIR / f"{key}.mp3"
-        if cache_file.exists():
-            audio_data = cache_file.read_bytes()
-            return base64.b64encode(audio_data).decode("utf-8")
-        return None
-
-    def _save_cache(self, key: str, audio_data: bytes):
-        """Save audio data to cache."""
-        cache_file = self.CACHE_DIR / f"{key}.mp3"
-        cache_file.write_bytes(audio_data)
+        """
+        Retrieve cached audio as base64 string — memory, then the pre-encoded
+        .b64 sidecar, then the MP3 (encoded once and the sidecar written).
+        """
+        with self._mem_lock:
+            audio_b64 = self._mem_cache.get(key)
+            if audio_b64 is not None:
+                self._mem_cache.move_to_end(key)
+                return audio_b64
+
+        try:
+            audio_b64 = (self._cache_path(key, ".b64")).read_text("ascii")
+        except FileNotFoundError:
+            audio_data = self._read_cache_file(key)
+            if audio_data is None:
+                return None
+            audio_b64 = base64.b64encode(memoryview(audio_data)).decode("ascii")
+            self._write_atomic(self._cache_path(key, ".b64"), audio_b64.encode("ascii"))
+        self._remember(key, audio_b64)
+        return audio_b64
+
+    def _read_cache_file(self, key: str) -> bytes:
+        """Raw cached MP3 bytes from disk, or None."""
+        try:
+            return (self._cache_path(key)).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _save_cache(self, key: str, audio_data: bytes, audio_b64: str = None):
+        """
+        Save audio data to cache. With base64 at hand, the .b64 sidecar and
+        memory layer are filled too; without it a stale sidecar is dropped.
+        """
+        self._write_atomic(self._cache_path(key), audio_data)
+        sidecar = self._cache_path(key, ".b64")
+        if audio_b64 is None:
+            sidecar.unlink(missing_ok=True)
+            return
+        self._write_atomic(sidecar, audio_b64.encode("ascii"))
+        self._remember(key, audio_b64)
+
+    def _write_atomic(self, path: Path, data: bytes):
+        """Write aside, then rename — a crash never leaves a torn file to be served."""
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _remember(self, key: str, audio_b64: str):
+        """Insert into the in-memory LRU, evicting the coldest entry when full."""
+        with self._mem_lock:
+            self._mem_cache[key] = audio_b64
+            self._mem_cache.move_to_end(key)
+            if len(self._mem_cache) > self.MEM_CACHE_SIZE:
+                self._mem_cache.popitem(last=False)
 
     def clear_cache(self) -> dict:
         """Clear the voice cache directory."""
-        count = 0
-        for f in self.CACHE_DIR.glob("*.mp3"):
-            f.unlink()
-            count += 1
+        with self._mem_lock:
+            self._mem_cache.clear()
+        count = self._clear_dir(self.CACHE_DIR)
+        with os.scandir(self.CACHE_DIR) as entries:
+            for entry in entries:
+                if len(entry.name) == 2 and entry.is_dir():
+                    count += self._clear_dir(entry.path)
         return {"cleared": count, "message": f"Removed {count} cached audio files"}
+
+    @staticmethod
+    def _clear_dir(path) -> int:
+        """Unlink cache files in one directory; returns the number of MP3s removed."""
+        count = 0
+        # scandir filters on the name alone — no per-file stat before unlink
+        with os.scandir(path) as entries:
+            for entry in entries:
+                is_audio = entry.name.endswith(".mp3")
+                if not is_audio and not entry.name.endswith((".b64", ".tmp")):
+                    continue
+                try:
+                    os.unlink(entry.path)
+                except FileNotFoundError:
+                    continue  # Removed concurrently by another worker
+                count += is_audio
+        return count
+
+    def _migrate_flat_cache(self):
+        """Move clips cached before sharding into their <key[:2]>/ subdirectory."""
+        with os.scandir(self.CACHE_DIR) as entries:
+            for entry in entries:
+                if not entry.name.endswith((".mp3", ".b64")) or not entry.is_file():
+                    continue
+                shard = self.CACHE_DIR / entry.name[:2]
+                shard.mkdir(exist_ok=True)
+                try:
+                    os.replace(entry.path, shard / entry.name)
+                except FileNotFoundError:
+                    pass  # Moved concurrently by another worker
@@ -10,6 +10,8 @@ from datetime import datetime, timezone
 from decimal import Decimal, ROUND_DOWN
 from config import HeliosConfig
 
+_ZERO = Decimal('0')
+
 
 class HeliosWallet:
     """
@@ -24,35 +26,7 @@ class HeliosWallet:
 
     def get_balance(self, helios_id: str) -> dict:
         """Get simple balance view for a member."""
-        from models.reward import Reward
-        from models.wallet_tx import WalletTransaction
-        from sqlalchemy import func
-
-        # Total earned from rewards
-        earned = self.db.query(
-            func.sum(Reward.amount)
-        ).filter(
-            Reward.member_id == helios_id,
-            Reward.status == "settled"
-        ).scalar() or Decimal('0')
-
-        # Total sent
-        sent = self.db.query(
-            func.sum(WalletTransaction.amount)
-        ).filter(
-            WalletTransaction.from_id == helios_id,
-            WalletTransaction.status == "completed"
-        ).scalar() or Decimal('0')
-
-        # Total received (transfers from other members)
-        received = self.db.query(
-            func.sum(WalletTransaction.amount)
-        ).filter(
-            WalletTransaction.to_id == helios_id,
-            WalletTransaction.status == "completed"
-        ).scalar() or Decimal('0')
-
-        balance = Decimal(str(earned)) + Decimal(str(received)) - Decimal(str(sent))
+        balance, earned, sent, received = self._compute_balance(helios_id)
 
         return {
             "helios_id": helios_id,
@@ -61,9 +35,47 @@ class HeliosWallet:
             "earned": float(earned),
             "sent": float(sent),
             "received": float(received),
-            "display": f"{float(balance):,.2f} {HeliosConfig.TOKEN_SYMBOL}"
+            "display": self._display(balance)
         }
 
+    def _compute_balance(self, helios_id: str) -> tuple:
+        """(balance, earned, sent, received) as Decimals — one round-trip."""
+        from models.reward import Reward
+        from models.wallet_tx import WalletTransaction
+        from sqlalchemy import func, select, type_coerce, Numeric
+
+        # Amount columns are Float; coercing the sums to Numeric has the
+        # driver layer hand back Decimals at token precision directly
+        def total(column):
+            return type_coerce(func.sum(column), Numeric(28, HeliosConfig.TOKEN_DECIMALS))
+
+        earned, sent, received = self.db.query(
+            # Total earned from rewards
+            select(total(Reward.amount)).where(
+                Reward.member_id == helios_id,
+                Reward.status == "settled"
+            ).scalar_subquery(),
+            # Total sent
+            select(total(WalletTransaction.amount)).where(
+                WalletTransaction.from_id == helios_id,
+                WalletTransaction.status == "completed"
+            ).scalar_subquery(),
+            # Total received (transfers from other members)
+            select(total(WalletTransaction.amount)).where(
+                WalletTransaction.to_id == helios_id,
+                WalletTransaction.status == "completed"
+            ).scalar_subquery()
+        ).one()
+
+        earned = earned or _ZERO
+        sent = sent or _ZERO
+        received = received or _ZERO
+        return earned + received - sent, earned, sent, received
+
+    @staticmethod
+    def _display(balance: Decimal) -> str:
+        return f"{float(balance):,.2f} {HeliosConfig.TOKEN_SYMBOL}"
+
     # ─── Transfers ────────────────────────────────────────────────────
 
     def send(self, from_id: str, to_id: str, amount: float, note: str = "") -> dict:
@@ -98,11 +110,11 @@ class HeliosWallet:
         if from_id == to_id:
             raise ValueError("Cannot send to yourself.")
 
-        # Check balance
-        balance = self.get_balance(from_id)
-        if Decimal(str(balance["balance"])) < amount_d:
+        # Check balance — computed once; the post-transfer balance is derived
+        balance = self._compute_balance(from_id)[0]
+        if balance < amount_d:
             raise ValueError(
-                f"Insufficient balance. You have {balance['display']}."
+                f"Insufficient balance. You have {self._display(balance)}."
             )
 
         # Execute transfer
@@ -124,63 +136,111 @@ class HeliosWallet:
             "to": to_id,
             "amount": float(amount_d),
             "note": note,
-            "new_balance": self.get_balance(from_id)["display"],
+            "new_balance": self._display(balance - amount_d),
             "timestamp": tx.created_at.isoformat(),
             "message": f"Sent {float(amount_d):,.2f} {HeliosConfig.TOKEN_SYMBOL} to {to_id}"
         }
 
     # ─── Transaction History ──────────────────────────────────────────
 
-    def get_history(self, helios_id: str, limit: int = 50) -> list:
-        """Get wallet transaction history — simple, human-readable."""
+    def get_history(self, helios_id: str, cursor: str = None,
+                    limit: int = 50) -> dict:
+        """
+        Get wallet transaction history — simple, human-readable.
+        Keyset-paginated: pass the previous page's next_cursor as cursor.
+        """
         from models.wallet_tx import WalletTransaction
         from models.reward import Reward
+        from sqlalchemy import select, literal, union_all, tuple_
+        from core.pagination import page_limit, encode_cursor, decode_cursor
+
+        limit = page_limit(limit)
+        position = decode_cursor(cursor, keys=2)
+
+        # Sent, received and rewards share one shape; the DB merges, sorts
+        # and limits so exactly `limit` rows come back. src breaks ties the
+        # way the old transfers-then-rewards merge did, then id (newest first).
+        sent = select(
+            literal("sent").label("type"),
+            WalletTransaction.amount,
+            WalletTransaction.to_id.label("other_party"),
+            WalletTransaction.note,
+            WalletTransaction.created_at,
+            literal(0).label("src"),
+            WalletTransaction.id
+        ).where(WalletTransaction.from_id == helios_id)
+
+        received = select(
+            literal("received"),
+            WalletTransaction.amount,
+            WalletTransaction.from_id,
+            WalletTransaction.note,
+            WalletTransaction.created_at,
+            literal(0),
+            WalletTransaction.id
+        ).where(
+            WalletTransaction.to_id == helios_id,
+            WalletTransaction.from_id != helios_id
+        )
 
-        # Get transfers
-        transfers = self.db.query(WalletTransaction).filter(
-            (WalletTransaction.from_id == helios_id) |
-            (WalletTransaction.to_id == helios_id)
-        ).order_by(WalletTransaction.created_at.desc()).limit(limit).all()
-
-        # Get rewards
-        rewards = self.db.query(Reward).filter_by(
-            member_id=helios_id, status="settled"
-        ).order_by(Reward.created_at.desc()).limit(limit).all()
-
-        # Combine and sort
+        rewards = select(
+            literal("reward"),
+            Reward.amount,
+            Reward.source_member_id,
+            Reward.reason,
+            Reward.created_at,
+            literal(1),
+            Reward.id
+        ).where(Reward.member_id == helios_id, Reward.status == "settled")
+
+        if position is not None:
+            # Rows after (ts, src, id) in (created_at desc, src, id desc)
+            # order. src is fixed per branch, so each branch gets a plain
+            # range on its own (owner, created_at, id) index.
+            ts, last_src, last_id = position
+
+            def after(branch, src, created_at, row_id):
+                if src < last_src:
+                    return branch.where(created_at < ts)
+                if src > last_src:
+                    return branch.where(created_at <= ts)
+                return branch.where(tuple_(created_at, row_id) < (ts, last_id))
+
+            sent = after(sent, 0, WalletTransaction.created_at, WalletTransaction.id)
+            received = after(received, 0, WalletTransaction.created_at, WalletTransaction.id)
+            rewards = after(rewards, 1, Reward.created_at, Reward.id)
+
+        merged = union_all(sent, received, rewards).subquery()
+        rows = self.db.execute(
+            select(merged)
+            .order_by(merged.c.created_at.desc(), merged.c.src, merged.c.id.desc())
+            .limit(limit)
+        ).all()
+
+        symbol = HeliosConfig.TOKEN_SYMBOL
         history = []
-
-        for tx in transfers:
-            is_sent = tx.from_id == helios_id
-            history.append({
-                "type": "sent" if is_sent else "received",
-                "amount": tx.amount,
-                "other_party": tx.to_id if is_sent else tx.from_id,
-                "note": tx.note,
-                "date": tx.created_at.isoformat(),
-                "display": (
-                    f"{'Sent' if is_sent else 'Received'} "
-                    f"{tx.amount:,.2f} {HeliosConfig.TOKEN_SYMBOL} "
-                    f"{'to' if is_sent else 'from'} "
-                    f"{tx.to_id if is_sent else tx.from_id}"
-                )
-            })
-
-        for r in rewards:
+        for kind, amount, other_party, note, created_at, _, _ in rows:
+            if kind == "reward":
+                display = f"Earned {amount:,.2f} {symbol} — {note}"
+            elif kind == "sent":
+                display = f"Sent {amount:,.2f} {symbol} to {other_party}"
+            else:
+                display = f"Received {amount:,.2f} {symbol} from {other_party}"
             history.append({
-                "type": "reward",
-                "amount": r.amount,
-                "other_party": r.source_member_id,
-                "note": r.reason,
-                "date": r.created_at.isoformat(),
-                "display": (
-                    f"Earned {r.amount:,.2f} {HeliosConfig.TOKEN_SYMBOL} — {r.reason}"
-                )
+                "type": kind,
+                "amount": amount,
+                "other_party": other_party,
+                "note": note,
+                "date": created_at.isoformat(),
+                "display": display
             })
-
-        # Sort by date descending
-        history.sort(key=lambda x: x["date"], reverse=True)
-        return history[:limit]
+        return {
+            "items": history,
+            "next_cursor": (
+                encode_cursor(rows[-1].created_at, rows[-1].src, rows[-1].id)
+                if len(rows) == limit else None
+            ),
+        }
 
     # ─── Export (Advanced Users) ──────────────────────────────────────
 
@@ -214,26 +274,32 @@ class HeliosWallet:
 
     # ─── Receive QR ───────────────────────────────────────────────────
 
-    def get_receive_qr(self, helios_id: str) -> dict:
-        """Generate a QR code for receiving payments."""
-        import qrcode
+    def get_receive_qr(self, helios_id: str, fmt: str = "png") -> dict:
+        """
+        Generate a QR code for receiving payments.
+        fmt="png" → base64 PNG in qr_code; fmt="svg" → SVG markup in qr_svg.
+        """
+        import segno
         import io
         import base64
 
         pay_url = f"helios://pay/{helios_id}"
 
-        qr = qrcode.QRCode(version=1, box_size=10, border=4)
-        qr.add_data(pay_url)
-        qr.make(fit=True)
-
-        img = qr.make_image(fill_color="#1a1a2e", back_color="#ffffff")
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        qr_b64 = base64.b64encode(buffer.getvalue()).decode()
-
-        return {
+        # segno encodes and renders directly — no PIL raster round-trip
+        qr = segno.make_qr(pay_url, error="m", boost_error=False)
+        result = {
             "helios_id": helios_id,
-            "qr_code": qr_b64,
             "pay_url": pay_url,
             "message": f"Scan to send {HeliosConfig.TOKEN_SYMBOL} to {helios_id}"
         }
+
+        if fmt == "svg":
+            result["qr_svg"] = qr.svg_inline(
+                scale=10, border=4, dark="#1a1a2e", light="#ffffff"
+            )
+            return result
+
+        buffer = io.BytesIO()
+        qr.save(buffer, kind="png", scale=10, border=4, dark="#1a1a2e", light="#ffffff")
+        result["qr_code"] = base64.b64encode(buffer.getvalue()).decode()
+        return result
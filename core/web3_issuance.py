@@ -12,6 +12,7 @@ Three issuance types on member join:
 All issuances are on-chain (XRPL NFTokenMint / Stellar custom ops).
 """
 
+import functools
 import hashlib
 import json
 import time
@@ -25,12 +26,48 @@ HLS_CURRENCY_CODE = "HLS"
 TOKEN_PRICE_PHASE1 = 0.05   # $0.05 per HLS — founding price
 TOKEN_PRICE_PHASE2 = 0.25
 TOKEN_PRICE_PHASE3 = 0.50
+_PHASE_PRICES = {1: TOKEN_PRICE_PHASE1, 2: TOKEN_PRICE_PHASE2, 3: TOKEN_PRICE_PHASE3}
 
 # NFT metadata URIs (IPFS-backed)
 CERT_METADATA_BASE = "ipfs://QmHeliosCertificates/"
 CEREMONIAL_METADATA_BASE = "ipfs://QmHeliosCeremonial/"
 
 
+def _canonical_json(payload: dict) -> bytes:
+    """
+    Compact, key-sorted UTF-8 JSON, so digests never depend on dict
+    construction order. Always the stdlib encoder: orjson formats floats
+    differently (1e-05 vs 0.00001), which would change tx hashes and
+    metadata URIs depending on what is installed.
+    """
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False,
+                      sort_keys=True).encode()
+
+
+def _payload_hash(payload: dict) -> str:
+    """SHA-256 hex of a payload — the on-chain tx fingerprint."""
+    return hashlib.sha256(_canonical_json(payload)).hexdigest()
+
+
+def _short_id(data: bytes, length: int) -> str:
+    """
+    Short content id of `length` hex chars for display ids and IPFS path
+    segments. BLAKE2b emits that digest size natively — no truncation.
+    """
+    return hashlib.blake2b(data, digest_size=length // 2).hexdigest()
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+@functools.lru_cache(maxsize=4096)
+def _member_id_hash(member_id: str) -> str:
+    """Short public fingerprint of a member id, embedded in NFT metadata."""
+    return _short_id(member_id.encode(), 16)
+
+
 class TokenIssuance:
     """Instant HLS token delivery to member wallets."""
 
@@ -40,8 +77,7 @@ class TokenIssuance:
         Calculate token allocation at current phase price.
         No bonuses — pure math at $0.05/HLS Phase 1.
         """
-        prices = {1: TOKEN_PRICE_PHASE1, 2: TOKEN_PRICE_PHASE2, 3: TOKEN_PRICE_PHASE3}
-        price = prices.get(phase, TOKEN_PRICE_PHASE1)
+        price = _PHASE_PRICES.get(phase, TOKEN_PRICE_PHASE1)
         tokens = usd_amount / price
 
         return {
@@ -49,11 +85,12 @@ class TokenIssuance:
             "phase": phase,
             "price_per_hls": price,
             "tokens_issued": tokens,
-            "formatted": f"{tokens:,.0f} HLS",
+            "formatted": format(tokens, ",.0f") + " HLS",
         }
 
     @staticmethod
-    def issue_tokens(member_id: str, xrpl_address: str, amount: float, phase: int = 1) -> dict:
+    def issue_tokens(member_id: str, xrpl_address: str, amount: float, phase: int = 1,
+                     issued_at: str = None) -> dict:
         """
         Issue HLS tokens directly to member's XRPL wallet.
         Uses Payment transaction from the issuing account.
@@ -78,7 +115,7 @@ class TokenIssuance:
             }]
         }
 
-        tx_hash = hashlib.sha256(json.dumps(tx).encode()).hexdigest()
+        tx_hash = _payload_hash(tx)
 
         return {
             "type": "token_issuance",
@@ -91,7 +128,7 @@ class TokenIssuance:
             "chain": "XRPL",
             "tx_hash": tx_hash,
             "status": "issued",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": issued_at or _now_iso(),
         }
 
 
@@ -100,7 +137,8 @@ class NFTCertificate:
 
     @staticmethod
     def mint_membership_nft(member_id: str, xrpl_address: str,
-                            contract_tier: str, gold_weight_oz: float) -> dict:
+                            contract_tier: str, gold_weight_oz: float,
+                            issued_at: str = None, member_id_hash: str = None) -> dict:
         """
         Mint an NFT certificate representing the member's gold-backed
         allocation. Issued on XRPL via NFTokenMint.
@@ -112,20 +150,21 @@ class NFTCertificate:
           - Issuance timestamp
           - Redemption terms hash
         """
+        issued_at = issued_at or _now_iso()
         metadata = {
             "name": f"Helios Gold Certificate — {contract_tier}",
             "description": "Gold-backed digital certificate issued by the Helios Protocol",
-            "member_id_hash": hashlib.sha256(member_id.encode()).hexdigest()[:16],
+            "member_id_hash": member_id_hash or _member_id_hash(member_id),
             "contract_tier": contract_tier,
             "gold_backing_oz": gold_weight_oz,
-            "issued_at": datetime.now(timezone.utc).isoformat(),
+            "issued_at": issued_at,
             "redeemable": True,
             "redemption_options": ["physical_gold", "stablecoin_usdc", "stablecoin_usdt"],
             "chain": "XRPL",
             "standard": "XLS-20",
         }
 
-        metadata_uri = f"{CERT_METADATA_BASE}{hashlib.sha256(json.dumps(metadata).encode()).hexdigest()[:24]}"
+        metadata_uri = f"{CERT_METADATA_BASE}{_short_id(_canonical_json(metadata), 24)}"
 
         nft_tx = {
             "TransactionType": "NFTokenMint",
@@ -136,7 +175,7 @@ class NFTCertificate:
             "TransferFee": 0,  # no royalty on certificates
         }
 
-        tx_hash = hashlib.sha256(json.dumps(nft_tx).encode()).hexdigest()
+        tx_hash = _payload_hash(nft_tx)
 
         return {
             "type": "nft_certificate",
@@ -148,7 +187,7 @@ class NFTCertificate:
             "metadata_uri": metadata_uri,
             "tx_hash": tx_hash,
             "status": "minted",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": issued_at,
         }
 
 
@@ -185,11 +224,13 @@ class CeremonialNFT:
 
     @staticmethod
     def mint_ceremonial(member_id: str, xrpl_address: str,
-                        member_type: str = "founding") -> dict:
+                        member_type: str = "founding",
+                        issued_at: str = None, member_id_hash: str = None) -> dict:
         """
         Mint a ceremonial NFT for the new member.
         Non-transferable (soulbound). One per member, ever.
         """
+        issued_at = issued_at or _now_iso()
         tier = CeremonialNFT.CEREMONIAL_TIERS.get(member_type,
                 CeremonialNFT.CEREMONIAL_TIERS["member"])
 
@@ -197,9 +238,9 @@ class CeremonialNFT:
             "name": tier["name"],
             "description": tier["description"],
             "rarity": tier["rarity"],
-            "member_id_hash": hashlib.sha256(member_id.encode()).hexdigest()[:16],
+            "member_id_hash": member_id_hash or _member_id_hash(member_id),
             "member_type": member_type,
-            "issued_at": datetime.now(timezone.utc).isoformat(),
+            "issued_at": issued_at,
             "transferable": tier["transferable"],
             "visual_asset": tier["visual"],
             "chain": "XRPL",
@@ -207,7 +248,7 @@ class CeremonialNFT:
             "soulbound": True,
         }
 
-        metadata_uri = f"{CEREMONIAL_METADATA_BASE}{hashlib.sha256(json.dumps(metadata).encode()).hexdigest()[:24]}"
+        metadata_uri = f"{CEREMONIAL_METADATA_BASE}{_short_id(_canonical_json(metadata), 24)}"
 
         nft_tx = {
             "TransactionType": "NFTokenMint",
@@ -218,7 +259,7 @@ class CeremonialNFT:
             "TransferFee": 0,
         }
 
-        tx_hash = hashlib.sha256(json.dumps(nft_tx).encode()).hexdigest()
+        tx_hash = _payload_hash(nft_tx)
 
         return {
             "type": "ceremonial_nft",
@@ -231,7 +272,7 @@ class CeremonialNFT:
             "metadata_uri": metadata_uri,
             "tx_hash": tx_hash,
             "status": "minted",
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": issued_at,
         }
 
 
@@ -239,7 +280,8 @@ class CeremonialNFT:
 
 def issue_new_member_package(member_id: str, xrpl_address: str,
                               contract_amount: float,
-                              member_type: str = "founding") -> dict:
+                              member_type: str = "founding",
+                              issued_at: str = None) -> dict:
     """
     Complete Web3 issuance for a new member:
       1. Instant HLS token delivery
@@ -248,9 +290,13 @@ def issue_new_member_package(member_id: str, xrpl_address: str,
 
     Called after atomic wallet provisioning completes.
     """
+    # One timestamp and member fingerprint for the whole package
+    issued_at = issued_at or _now_iso()
+    member_id_hash = _member_id_hash(member_id)
+
     # 1. Token issuance
     token_result = TokenIssuance.issue_tokens(
-        member_id, xrpl_address, contract_amount, phase=1
+        member_id, xrpl_address, contract_amount, phase=1, issued_at=issued_at
     )
 
     # 2. NFT certificate (gold weight based on 15% treasury allocation)
@@ -259,12 +305,15 @@ def issue_new_member_package(member_id: str, xrpl_address: str,
     cert_result = NFTCertificate.mint_membership_nft(
         member_id, xrpl_address,
         contract_tier=f"${contract_amount:,.0f}",
-        gold_weight_oz=round(gold_oz, 4)
+        gold_weight_oz=round(gold_oz, 4),
+        issued_at=issued_at,
+        member_id_hash=member_id_hash
     )
 
     # 3. Ceremonial NFT
     ceremonial_result = CeremonialNFT.mint_ceremonial(
-        member_id, xrpl_address, member_type
+        member_id, xrpl_address, member_type,
+        issued_at=issued_at, member_id_hash=member_id_hash
     )
 
     return {
@@ -283,10 +332,27 @@ def issue_new_member_package(member_id: str, xrpl_address: str,
             "total_nfts": 2,
             "chain": "XRPL",
         },
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": issued_at,
     }
 
 
+def issue_new_member_packages(rows: list) -> list:
+    """
+    Bulk onboarding (e.g. a founder CSV import). Each row holds the
+    issue_new_member_package arguments: member_id, xrpl_address,
+    contract_amount and optionally member_type. The whole batch shares
+    one issuance timestamp. Returns the packages in row order.
+    """
+    issued_at = _now_iso()
+    return [
+        issue_new_member_package(
+            row["member_id"], row["xrpl_address"], row["contract_amount"],
+            row.get("member_type", "founding"), issued_at=issued_at
+        )
+        for row in rows
+    ]
+
+
 # ── Web3 Preferences ──────────────────────────────────────────────────
 
 class Web3Preferences:
@@ -317,7 +383,11 @@ class Web3Preferences:
 
     def __init__(self, member_id: str, prefs: dict = None):
         self.member_id = member_id
-        self.preferences = {**self.DEFAULT_PREFERENCES, **(prefs or {})}
+        # Plain copy of the defaults unless there are overrides to merge
+        if prefs:
+            self.preferences = {**self.DEFAULT_PREFERENCES, **prefs}
+        else:
+            self.preferences = self.DEFAULT_PREFERENCES.copy()
 
     def update(self, key: str, value) -> dict:
         """Update a single preference."""
@@ -2,12 +2,15 @@
 import pathlib
 
 path = pathlib.Path(r"C:\Users\Kevan\helios-os\templates\base.html")
-content = path.read_text(encoding="utf-8")
+# Work on raw bytes: every needle and insert is ASCII, so no decode/encode
+# round-trip is needed. Inserted lines follow the file's own line endings.
+content = path.read_bytes()
+eol = b"\r\n" if b"\r\n" in content else b"\n"
 
 # ── 1. Add 'Ask Helios' nav link before Treasury ──────────────────
 old_nav = '<a href="/treasury">Treasury</a>'
 new_nav = '<a href="/ask" class="nav-ask">Ask Helios</a>\n                <a href="/treasury">Treasury</a>'
-content = content.replace(old_nav, new_nav, 1)
+content = content.replace(old_nav.encode(), new_nav.encode().replace(b"\n", eol), 1)
 
 # ── 2. Add floating AI agent widget before {% block scripts %} ────
 fab_widget = """    <!-- FLOATING AI AGENT -->
@@ -37,14 +40,13 @@ fab_widget = """    <!-- FLOATING AI AGENT -->
 
 old_scripts = "    {% block scripts %}{% endblock %}"
 new_scripts = fab_widget + "    {% block scripts %}{% endblock %}"
-content = content.replace(old_scripts, new_scripts, 1)
+content = content.replace(old_scripts.encode(), new_scripts.encode().replace(b"\n", eol), 1)
 
-path.write_text(content, encoding="utf-8")
+path.write_bytes(content)
 
-# Verify
-final = path.read_text(encoding="utf-8")
-print(f"OK  base.html updated ({len(final)} chars)")
-print(f"  nav-ask link:  {'nav-ask' in final}")
-print(f"  helios-fab:    {'helios-fab' in final}")
-print(f"  fab-core:      {'fab-core' in final}")
-print(f"  fab-breathe:   {'fab-breathe' in final}")
+# Verify against what was just written — no second read
+print(f"OK  base.html updated ({len(content)} bytes)")
+print(f"  nav-ask link:  {b'nav-ask' in content}")
+print(f"  helios-fab:    {b'helios-fab' in content}")
+print(f"  fab-core:      {b'fab-core' in content}")
+print(f"  fab-breathe:   {b'fab-breathe' in content}")
@@ -10,7 +10,18 @@ Uses a custom encoder that handles the 5 "undefined" cp1252 positions
 (0x81, 0x8D, 0x8F, 0x90, 0x9D) as pass-through.
 """
 import os
+import sys
 import glob
+import codecs
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Optional accelerator — the scan falls back to pure Python
+    np = None
+    njit = None
 
 TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
 
@@ -37,81 +48,94 @@ for byte_val in range(0x80, 0xC0):
     CONT_CHARS.add(_FWD[byte_val])
 
 
+# C-level charmap encoder over the same 256-entry table (as the stdlib cp1252 codec does)
+_ENCODING_MAP = codecs.charmap_build(''.join(_FWD[b] for b in range(256)))
+
+
+# UTF-8 lead byte shared by U+00C0-U+00FF, the range every mojibake lead char falls in
+MOJIBAKE_LEAD_BYTE = b'\xc3'
+
+
 def sloppy_cp1252_encode(text):
     """Encode a Unicode string to bytes using sloppy cp1252 (with pass-through)."""
-    result = bytearray()
-    for ch in text:
-        byte_val = _REV.get(ch)
-        if byte_val is not None:
-            result.append(byte_val)
-        else:
-            raise UnicodeEncodeError('sloppy-cp1252', ch, 0, 1, 'character not in sloppy cp1252')
-    return bytes(result)
+    return codecs.charmap_encode(text, 'strict', _ENCODING_MAP)[0]
 
 
-def fix_mojibake(text):
+# Code point -> sloppy-cp1252 byte, 0xFFFF where the char has no byte.
+# Every mapped char sits at or below U+2122, so a dense table covers them.
+_BYTE_OF = [0xFFFF] * (max(map(ord, _REV)) + 1)
+for ch, b in _REV.items():
+    _BYTE_OF[ord(ch)] = b
+
+
+def _scan_kernel(codes, byte_of, out):
     """
-    Iterate through text and fix mojibake sequences by attempting
-    sloppy-cp1252 encode -> utf-8 decode round-trip.
-    Returns (fixed_text, fix_count).
+    Mojibake scan over code points. A lead char (its code point is also its
+    cp1252 byte) followed by continuation chars is re-read as one UTF-8
+    sequence, with the same validity rules as the strict UTF-8 decoder
+    (no overlongs, surrogates or code points past U+10FFFF). Writes the
+    result to `out`; returns (output length, fix count).
     """
-    result = []
-    fixes = 0
+    n = len(codes)
+    size = len(byte_of)
     i = 0
-    n = len(text)
-
+    j = 0
+    fixes = 0
     while i < n:
-        ch = text[i]
-        code = ord(ch)
-        fixed = False
-
-        # 4-byte UTF-8 lead (0xF0-0xF4)
+        code = codes[i]
+        width = 0
         if 0xF0 <= code <= 0xF4 and i + 3 < n:
-            seq = text[i:i+4]
-            if all(c in CONT_CHARS for c in seq[1:]):
-                try:
-                    raw = sloppy_cp1252_encode(seq)
-                    recovered = raw.decode('utf-8')
-                    result.append(recovered)
-                    fixes += 1
-                    i += 4
-                    fixed = True
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    pass
-
-        # 3-byte UTF-8 lead (0xE0-0xEF)
-        if not fixed and 0xE0 <= code <= 0xEF and i + 2 < n:
-            seq = text[i:i+3]
-            if all(c in CONT_CHARS for c in seq[1:]):
-                try:
-                    raw = sloppy_cp1252_encode(seq)
-                    recovered = raw.decode('utf-8')
-                    result.append(recovered)
-                    fixes += 1
-                    i += 3
-                    fixed = True
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    pass
-
-        # 2-byte UTF-8 lead (0xC2-0xDF)
-        if not fixed and 0xC2 <= code <= 0xDF and i + 1 < n:
-            seq = text[i:i+2]
-            if seq[1] in CONT_CHARS:
-                try:
-                    raw = sloppy_cp1252_encode(seq)
-                    recovered = raw.decode('utf-8')
-                    result.append(recovered)
-                    fixes += 1
-                    i += 2
-                    fixed = True
-                except (UnicodeDecodeError, UnicodeEncodeError):
-                    pass
+            width, cp, low = 4, code & 0x07, 0x10000
+        elif 0xE0 <= code <= 0xEF and i + 2 < n:
+            width, cp, low = 3, code & 0x0F, 0x800
+        elif 0xC2 <= code <= 0xDF and i + 1 < n:
+            width, cp, low = 2, code & 0x1F, 0x80
+        if width:
+            for k in range(1, width):
+                c = codes[i + k]
+                b = byte_of[c] if c < size else 0xFFFF
+                if b < 0x80 or b > 0xBF:
+                    cp = -1
+                    break
+                cp = (cp << 6) | (b & 0x3F)
+            if cp >= low and cp <= 0x10FFFF and not 0xD800 <= cp <= 0xDFFF:
+                out[j] = cp
+                j += 1
+                i += width
+                fixes += 1
+                continue
+        out[j] = code
+        j += 1
+        i += 1
+    return j, fixes
+
+
+# array('I') holds native-order 32-bit code points
+_UTF32_NATIVE = 'utf-32-le' if sys.byteorder == 'little' else 'utf-32-be'
+
+if njit is not None:
+    _scan_kernel = njit(cache=True)(_scan_kernel)
+    _BYTE_OF = np.asarray(_BYTE_OF, dtype=np.int64)
 
-        if not fixed:
-            result.append(ch)
-            i += 1
 
-    return ''.join(result), fixes
+def fix_mojibake(text):
+    """
+    Iterate through text and fix mojibake sequences by attempting
+    sloppy-cp1252 encode -> utf-8 decode round-trip.
+    Returns (fixed_text, fix_count).
+    """
+    # Code points in and out as packed 32-bit buffers — no per-char objects;
+    # the result is decoded in one call
+    if njit is not None:
+        codes = np.frombuffer(text.encode('utf-32-le'), dtype='<u4')
+        out = np.empty_like(codes)
+        n_out, fixes = _scan_kernel(codes, _BYTE_OF, out)
+        return out[:n_out].tobytes().decode('utf-32-le'), fixes
+
+    codes = array('I', text.encode(_UTF32_NATIVE))
+    out = array('I', bytes(len(codes) * codes.itemsize))
+    n_out, fixes = _scan_kernel(codes, _BYTE_OF, out)
+    return out[:n_out].tobytes().decode(_UTF32_NATIVE), fixes
 
 
 # ASCII chars that may have replaced smart-quote cp1252 chars
@@ -141,19 +165,17 @@ def fix_partial_mojibake(text):
         if 0xE0 <= code <= 0xEF and i + 2 < n:
             c2, c3 = text[i+1], text[i+2]
             if c2 in CONT_CHARS and c3 in QUOTE_SUBS:
-                # Try substituting the ASCII quote with each smart-quote variant
+                # Try substituting the ASCII quote with each smart-quote variant,
+                # decoding the 3-byte sequence arithmetically (strict UTF-8 rules)
+                high = ((code & 0x0F) << 12) | ((_REV[c2] & 0x3F) << 6)
                 for smart_q in QUOTE_SUBS[c3]:
-                    seq = ch + c2 + smart_q
-                    try:
-                        raw = sloppy_cp1252_encode(seq)
-                        recovered = raw.decode('utf-8')
-                        result.append(recovered)
+                    cp = high | (_REV[smart_q] & 0x3F)
+                    if cp >= 0x800 and not 0xD800 <= cp <= 0xDFFF:
+                        result.append(chr(cp))
                         fixes += 1
                         i += 3
                         fixed = True
                         break
-                    except (UnicodeDecodeError, UnicodeEncodeError):
-                        continue
 
         if not fixed:
             result.append(ch)
@@ -164,6 +186,12 @@ def fix_partial_mojibake(text):
 
 def fix_file(filepath):
     """Fix all mojibake in a single template file. Returns count of fixes."""
+    # Every lead char either pass acts on is in U+00C2-U+00F4, and all of
+    # those encode to UTF-8 starting with 0xC3. No 0xC3 byte: nothing to fix.
+    with open(filepath, 'rb') as f:
+        if MOJIBAKE_LEAD_BYTE not in f.read():
+            return 0
+
     with open(filepath, 'r', encoding='utf-8') as f:
         text = f.read()
 
@@ -192,10 +220,13 @@ def main():
     templates = sorted(glob.glob(os.path.join(TEMPLATE_DIR, '*.html')))
     print(f"Scanning {len(templates)} template files...\n")
 
+    # Files are independent — fix them in parallel, report in sorted order
     grand_total = 0
-    for fpath in templates:
+    workers = max(1, min(len(templates), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(fix_file, templates))
+    for fpath, fixes in zip(templates, results):
         fname = os.path.basename(fpath)
-        fixes = fix_file(fpath)
         if fixes > 0:
             print(f"  FIXED: {fname} ({fixes} replacements)")
             grand_total += fixes
@@ -6,11 +6,104 @@ Freezes the Flask app into static HTML for deployment.
 import os
 import sys
 import shutil
+import mmap
+import hashlib
 import datetime
 import re
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from jinja2 import TemplateError
 from app import create_app
 
+# Per-worker render state, set once by _init_worker
+_client = None
+_build_dir = None
+
+
+def _init_worker(build_dir):
+    """
+    Build one app + test client per worker process, with every template
+    compiled up front so no page pays first-render compile cost.
+    """
+    global _client, _build_dir
+    app = create_app()
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    for name in app.jinja_env.list_templates():
+        try:
+            app.jinja_env.get_template(name)
+        except TemplateError:
+            pass  # Surfaces as a failed page if a route actually renders it
+    _client = app.test_client()
+    _build_dir = build_dir
+
+
+def _freeze_page(page):
+    """
+    Render one route into the build dir, streaming the body to disk and
+    hashing it on the way. Returns (status line, sha256 hex or None).
+    """
+    route, output_path = page
+    try:
+        response = _client.get(route)
+        if response.status_code == 200:
+            full_path = os.path.join(_build_dir, output_path)
+            digest = hashlib.sha256()
+            with open(full_path, "wb") as f:
+                for chunk in response.iter_encoded():
+                    digest.update(chunk)
+                    f.write(chunk)
+            return f"  ✓ {route} → {output_path}", digest.hexdigest()
+        return f"  ✗ {route} → HTTP {response.status_code}", None
+    except Exception as e:
+        return f"  ✗ {route} → Error: {e}", None
+
+
+# Every validator check in one scan, run over the page's raw bytes. Only the
+# Google Fonts stylesheet request is validated, not preconnect; the font
+# pattern alone is case-insensitive.
+_VALIDATE_RE = re.compile(
+    rb"(?P<malformed>rel=\"styleshee(?: |%20)et\")"
+    rb"|(?P<font>(?i:<link\b[^>]*href=\"https://fonts\.googleapis\.com/(?:css2|css)[^\"]*\"[^>]*>))"
+    rb"|(?P<css>/static/css/helios\.css)"
+)
+_REL_RE = re.compile(rb"\brel=\"([^\"]+)\"", re.IGNORECASE)
+
+
+def _is_html_page(buf):
+    """Whether the first 1000 chars mention <html (frozen JSON endpoints don't)."""
+    # 1000 chars never span more than 4000 bytes of UTF-8
+    head = buf[:4000].decode("utf-8", errors="replace")
+    head = head.replace("\r\n", "\n").replace("\r", "\n")[:1000]
+    return "<html" in head.lower()
+
+
+def _validate_html(html):
+    """Problems found in one frozen HTML page (raw bytes), as a list of reasons."""
+    reasons = []
+    has_css = False
+    font_checked = False
+    for match in _VALIDATE_RE.finditer(html):
+        kind = match.lastgroup
+        if kind == "css":
+            has_css = True
+            continue
+        tag = match.group(0)
+        # A font <link> match swallows anything inside the tag, so look there too
+        if kind == "malformed" or b"rel=\"styleshee et\"" in tag or b"rel=\"styleshee%20et\"" in tag:
+            return ["malformed rel attribute (styleshee et)"]
+        has_css = has_css or b"/static/css/helios.css" in tag
+        if not font_checked:
+            m = _REL_RE.search(tag)
+            rel_val = (m.group(1) if m else b"").decode("utf-8", errors="replace").strip().lower()
+            if "stylesheet" not in rel_val:
+                reasons.append(f"fonts.googleapis.com stylesheet link missing rel=stylesheet (rel={rel_val or 'MISSING'})")
+                font_checked = True
+
+    if not has_css:
+        reasons.append("missing /static/css/helios.css link")
+    return reasons
+
+
 def freeze():
     """Export all page routes as static HTML files."""
     # Stamp each build so we can verify what's deployed.
@@ -29,7 +122,8 @@ def freeze():
         build_id = f"{ts}-{git_sha}"
         os.environ["HELIOS_BUILD_ID"] = build_id
 
-    app = create_app()
+    # Tables get created here, before workers would race to create them
+    create_app()
     build_dir = os.path.join(os.path.dirname(__file__), "build")
 
     # Clean build directory
@@ -66,20 +160,24 @@ def freeze():
         ("/health", "health/index.html"),
     ]
 
-    with app.test_client() as client:
-        for route, output_path in pages:
-            try:
-                response = client.get(route)
-                if response.status_code == 200:
-                    full_path = os.path.join(build_dir, output_path)
-                    os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                    with open(full_path, "wb") as f:
-                        f.write(response.data)
-                    print(f"  ✓ {route} → {output_path}")
-                else:
-                    print(f"  ✗ {route} → HTTP {response.status_code}")
-            except Exception as e:
-                print(f"  ✗ {route} → Error: {e}")
+    # Pages are independent and every output path is unique — render them
+    # in parallel, one contiguous chunk per worker, printed in page order
+    # Output directories are created once here, not probed per page
+    for out_dir in {os.path.dirname(os.path.join(build_dir, p)) for _, p in pages}:
+        os.makedirs(out_dir, exist_ok=True)
+
+    workers = min(len(pages), os.cpu_count() or 1)
+    chunksize = -(-len(pages) // workers)
+    manifest = []
+    written = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(build_dir,)) as pool:
+        results = pool.map(_freeze_page, pages, chunksize=chunksize)
+        for (_route, output_path), (line, digest) in zip(pages, results):
+            print(line)
+            if digest:
+                manifest.append(f"{digest}  {output_path}\n")
+                written.append(output_path)
 
     # Persist build id for deploy/debug.
     try:
@@ -88,45 +186,35 @@ def freeze():
     except Exception as e:
         print(f"  ✗ BUILD_ID.txt → Error: {e}")
 
+    # Integrity manifest of the frozen pages (`sha256sum -c` format)
+    try:
+        with open(os.path.join(build_dir, "SHA256SUMS.txt"), "w", encoding="utf-8") as f:
+            f.writelines(manifest)
+    except Exception as e:
+        print(f"  ✗ SHA256SUMS.txt → Error: {e}")
+
     # Validate frozen HTML to prevent production-only blank pages caused by malformed tags.
     # This specifically guards against the historical `rel=\"styleshee et\"` issue.
-    html_files = []
-    for root, _dirs, files in os.walk(build_dir):
-        for name in files:
-            if name.lower().endswith(".html"):
-                html_files.append(os.path.join(root, name))
+    # The build dir was emptied above, so the pages just written are all the HTML in it
+    html_files = [
+        os.path.join(build_dir, output_path)
+        for output_path in written
+        if output_path.lower().endswith(".html")
+    ]
 
     bad_files = []
-    # Only validate the actual Google Fonts stylesheet request, not preconnect.
-    font_css_link_re = re.compile(
-        r"<link\b[^>]*href=\"https://fonts\.googleapis\.com/(?:css2|css)[^\"]*\"[^>]*>",
-        re.IGNORECASE,
-    )
-    rel_re = re.compile(r"\brel=\"([^\"]+)\"", re.IGNORECASE)
     for path in html_files:
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                html = f.read()
-
-            # Skip non-HTML outputs (e.g., frozen JSON endpoints like /health).
-            head_sample = html[:1000].lower()
-            if "<html" not in head_sample:
-                continue
-
-            if "rel=\"styleshee et\"" in html or "rel=\"styleshee%20et\"" in html:
-                bad_files.append((path, "malformed rel attribute (styleshee et)"))
-                continue
-
-            for match in font_css_link_re.finditer(html):
-                tag = match.group(0)
-                m = rel_re.search(tag)
-                rel_val = (m.group(1) if m else "").strip().lower()
-                if "stylesheet" not in rel_val:
-                    bad_files.append((path, f"fonts.googleapis.com stylesheet link missing rel=stylesheet (rel={rel_val or 'MISSING'})"))
-                    break
-
-            if "/static/css/helios.css" not in html:
-                bad_files.append((path, "missing /static/css/helios.css link"))
+            # Scan the mapped file directly — only matched tags are ever decoded
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as html:
+                    # Skip non-HTML outputs (e.g., frozen JSON endpoints like /health).
+                    if not _is_html_page(html):
+                        continue
+                    reasons = _validate_html(html)
+            bad_files.extend((path, reason) for reason in reasons)
         except Exception as e:
             bad_files.append((path, f"validator exception: {e}"))
 
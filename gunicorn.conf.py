@@ -0,0 +1,25 @@
+"""
+☀ HELIOS — gunicorn settings
+═══════════════════════════════════════
+Loaded automatically by `gunicorn wsgi:application` run from this directory.
+
+The app is built once in the master (create_app, template bytecode, genesis
+check) and forked, so workers share those pages copy-on-write. Each worker
+serves requests on a thread pool, like the waitress fallback in wsgi.py.
+Every value can be overridden from the environment.
+"""
+
+import os
+
+bind = os.getenv("HELIOS_BIND", f"0.0.0.0:{os.getenv('HELIOS_PORT', '5050')}")
+preload_app = True
+worker_class = "gthread"
+workers = int(os.getenv("HELIOS_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+threads = int(os.getenv("HELIOS_THREADS", "4"))
+
+
+def post_fork(server, worker):
+    # The master's pooled DB connections must not be shared across processes:
+    # drop them (without closing the parent's) so each worker opens its own
+    from wsgi import application
+    application.extensions["helios_engine"].dispose(close=False)
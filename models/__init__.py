@@ -1,17 +1,24 @@
 """Helios Models Package — Neural Field + Energy Exchange"""
 
-from models.member import Member
-from models.bond import Bond
-from models.transaction import Transaction
-from models.reward import Reward
-from models.token_pool import TokenPool
-from models.wallet_tx import WalletTransaction
-from models.vault_receipt import VaultReceipt
-from models.certificate import Certificate
-from models.energy_event import EnergyEvent
-from models.credential import Credential
-from models.space import Space, SpaceEvent
-from models.subscription import Subscription
+import importlib
+
+# Model name -> defining module. Submodules load on first attribute access
+# (PEP 562), so `import models` alone pulls in no SQLAlchemy mappings.
+_LAZY = {
+    "Member": "models.member",
+    "Bond": "models.bond",
+    "Transaction": "models.transaction",
+    "Reward": "models.reward",
+    "TokenPool": "models.token_pool",
+    "WalletTransaction": "models.wallet_tx",
+    "VaultReceipt": "models.vault_receipt",
+    "Certificate": "models.certificate",
+    "EnergyEvent": "models.energy_event",
+    "Credential": "models.credential",
+    "Space": "models.space",
+    "SpaceEvent": "models.space",
+    "Subscription": "models.subscription",
+}
 
 __all__ = [
     "Member", "Bond", "Transaction",
@@ -19,3 +26,17 @@ __all__ = [
     "VaultReceipt", "Certificate", "EnergyEvent",
     "Credential", "Space", "SpaceEvent", "Subscription"
 ]
+
+
+def __getattr__(name):
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
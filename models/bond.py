@@ -8,7 +8,7 @@ Bond State Machine: DISCOVER → BOUND → ACTIVE → INACTIVE
 """
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Integer, UniqueConstraint
+from sqlalchemy import Column, String, DateTime, Integer, UniqueConstraint, Index
 from models.member import Base
 
 
@@ -18,8 +18,8 @@ class Bond(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Undirected: node_a < node_b (lexicographic) to prevent duplicates
-    node_a = Column(String(64), nullable=False, index=True)
-    node_b = Column(String(64), nullable=False, index=True)
+    node_a = Column(String(64), nullable=False)
+    node_b = Column(String(64), nullable=False)
 
     # Bond state machine
     state = Column(String(20), default="bound", index=True)
@@ -34,6 +34,10 @@ class Bond(Base):
     # Ensure no duplicate bonds between same pair
     __table_args__ = (
         UniqueConstraint('node_a', 'node_b', name='uq_bond_pair'),
+        # Covering indexes for "bonds of X" in either direction — query each
+        # column as its own leg (UNION ALL) rather than OR-ing them
+        Index('ix_bond_a_b_state', 'node_a', 'node_b', 'state'),
+        Index('ix_bond_b_a_state', 'node_b', 'node_a', 'state'),
     )
 
     def __repr__(self):
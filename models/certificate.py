@@ -10,10 +10,28 @@ State Machine: ACTIVE -> REDEEMED   (gold or stablecoin exit)
                ACTIVE -> CANCELLED  (2% energy burned permanently - irreversible)
 """
 
+import functools
 import hashlib
 from datetime import datetime, timezone
 from sqlalchemy import Column, String, DateTime, Integer, Float, Text, Boolean
-from models.member import Base
+from sqlalchemy.orm import relationship
+from config import HeliosConfig
+from models.member import Base, utcnow
+from models.vault_receipt import VaultReceipt  # noqa: F401 — resolves Certificate.linked_mvr
+
+# Resolved once; hashlib's SHA-256 is OpenSSL's, which takes the SHA-NI path
+# on CPUs that have it. Certificate ids must stay SHA-256 to remain stable.
+_sha256 = hashlib.sha256
+
+_CANCEL_FRICTION = HeliosConfig.CERTIFICATE_CANCEL_FRICTION
+
+
+# typed: an int and a float epoch format differently, so they must not share a slot
+@functools.lru_cache(maxsize=8192, typed=True)
+def _certificate_hash(holder_id, energy_amount_he, epoch_timestamp, mint_rate) -> str:
+    """Memoized — replays and idempotency checks re-hash the same mint tuple."""
+    payload = f"{holder_id}|{energy_amount_he:.8f}|{epoch_timestamp}|{mint_rate:.8f}"
+    return _sha256(payload.encode()).hexdigest()
 
 
 class Certificate(Base):
@@ -50,29 +68,36 @@ class Certificate(Base):
 
     # === Timestamps ===
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, onupdate=utcnow())
+
+    # MVR backing a gold redemption (view-only, keyed by mvr_id). Lazy by
+    # default; list views that render it opt in with selectinload().
+    linked_mvr = relationship(
+        "VaultReceipt",
+        primaryjoin="foreign(Certificate.linked_mvr_id) == VaultReceipt.mvr_id",
+        viewonly=True,
+    )
 
     def __repr__(self):
         h = self.content_hash[:12] if self.content_hash else "none"
         return f"<HC-NFT {self.certificate_id} | {self.energy_amount_he} HE [{self.state}] hash={h}>"
 
-    def to_dict(self):
-        return {
-            "certificate_id": self.certificate_id,
-            "content_hash": self.content_hash,
-            "holder_id": self.holder_id,
-            "energy_amount_he": self.energy_amount_he,
-            "energy_value_usd": self.energy_value_usd,
-            "state": self.state,
-            "is_final": self.is_final,
-            "redemption_type": self.redemption_type,
-            "redemption_amount": self.redemption_amount,
-            "friction_paid": self.friction_paid,
-            "energy_burned_he": self.energy_burned_he,
-            "linked_mvr_id": self.linked_mvr_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "redeemed_at": self.redeemed_at.isoformat() if self.redeemed_at else None,
-        }
+    _dict_fields = (
+        "certificate_id",
+        "content_hash",
+        "holder_id",
+        "energy_amount_he",
+        "energy_value_usd",
+        "state",
+        "is_final",
+        "redemption_type",
+        "redemption_amount",
+        "friction_paid",
+        "energy_burned_he",
+        "linked_mvr_id",
+        "created_at",
+        "redeemed_at",
+    )
 
     @property
     def is_active(self):
@@ -81,15 +106,26 @@ class Certificate(Base):
     @property
     def cancel_friction_amount(self):
         """2% friction if cancelled."""
-        from config import HeliosConfig
-        return self.energy_value_usd * HeliosConfig.CERTIFICATE_CANCEL_FRICTION
+        return self.energy_value_usd * _CANCEL_FRICTION
 
     @staticmethod
     def compute_certificate_hash(holder_id: str, energy_amount_he: float,
                                   epoch_timestamp: int, mint_rate: float) -> str:
         """Deterministic SHA256: key + amount + timestamp + rate."""
-        payload = f"{holder_id}|{energy_amount_he:.8f}|{epoch_timestamp}|{mint_rate:.8f}"
-        return hashlib.sha256(payload.encode()).hexdigest()
+        return _certificate_hash(holder_id, energy_amount_he, epoch_timestamp, mint_rate)
+
+    @staticmethod
+    def compute_certificate_hashes(records) -> list:
+        """
+        Batch form of compute_certificate_hash for bulk mints and
+        verification sweeps. `records` yields
+        (holder_id, energy_amount_he, epoch_timestamp, mint_rate) tuples.
+        Bypasses the memo so a large sweep doesn't evict it.
+        """
+        return [
+            _sha256(f"{holder}|{amount:.8f}|{epoch}|{rate:.8f}".encode()).hexdigest()
+            for holder, amount, epoch, rate in records
+        ]
 
     @staticmethod
     def generate_certificate_id(content_hash: str) -> str:
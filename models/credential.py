@@ -7,8 +7,9 @@ Vendor: sell products/services within the Helios economy.
 Host: host events and experiences within spaces.
 """
 
+import time
 from datetime import datetime, timezone, timedelta
-from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean
+from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean, Index
 from models.member import Base
 
 
@@ -35,24 +36,38 @@ class Credential(Base):
     verified_by = Column(String(64), nullable=True)                   # Who approved
     verification_notes = Column(String(280), nullable=True)
 
+    # Role checks: holder + type + active (semi-join in create_space)
+    __table_args__ = (
+        Index('ix_credential_holder_type_active', 'holder_id', 'credential_type', 'is_active'),
+    )
+
     def __repr__(self):
         return f"<Credential {self.credential_type} | {self.holder_id} [{'active' if self.is_active else 'expired'}]>"
 
-    def to_dict(self):
-        return {
-            "credential_id": self.credential_id,
-            "holder_id": self.holder_id,
-            "credential_type": self.credential_type,
-            "fee_paid_usd": self.fee_paid_usd,
-            "is_active": self.is_active,
-            "issued_at": self.issued_at.isoformat() if self.issued_at else None,
-            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
-            "renewed_count": self.renewed_count,
-        }
+    _dict_fields = (
+        "credential_id",
+        "holder_id",
+        "credential_type",
+        "fee_paid_usd",
+        "is_active",
+        "issued_at",
+        "expires_at",
+        "renewed_count",
+    )
+
+    # (expires_at, epoch seconds) — recomputed only when expires_at is replaced
+    _expires_cache = None
 
     @property
     def is_expired(self):
-        return datetime.now(timezone.utc) > self.expires_at
+        cached = self._expires_cache
+        if cached is None or cached[0] is not self.expires_at:
+            expires_at = self.expires_at
+            # Stored timestamps come back naive; they are UTC
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            cached = self._expires_cache = (self.expires_at, expires_at.timestamp())
+        return time.time() > cached[1]
 
     def check_and_deactivate(self):
         """Deactivate if expired."""
@@ -60,3 +75,16 @@ class Credential(Base):
             self.is_active = False
             return True
         return False
+
+    @classmethod
+    def deactivate_expired(cls, session, now: datetime = None) -> int:
+        """Deactivate every lapsed credential in one UPDATE. Returns the count."""
+        from sqlalchemy import update
+
+        result = session.execute(
+            update(cls)
+            .where(cls.is_active.is_(True), cls.expires_at < (now or datetime.now(timezone.utc)))
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -7,18 +7,19 @@ Types: ENERGY_IN, ENERGY_ROUTE, ENERGY_STORE, ENERGY_POOL,
 """
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Integer, Float, JSON
-from models.member import Base
+from sqlalchemy import Column, String, DateTime, Integer, Float, Index
+from sqlalchemy.orm import deferred
+from models.member import Base, JSONDocument, LedgerMixin
 
 
-class EnergyEvent(Base):
+class EnergyEvent(LedgerMixin, Base):
     __tablename__ = "energy_events"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # ═══ Event Identity ═══
     event_id = Column(String(64), unique=True, nullable=False, index=True)
-    event_type = Column(String(20), nullable=False, index=True)      # ENERGY_IN, ENERGY_ROUTE, etc.
+    event_type = Column(String(20), nullable=False)                  # ENERGY_IN, ENERGY_ROUTE, etc.
 
     # ═══ Parties ═══
     from_id = Column(String(64), nullable=True, index=True)          # Source (null for ENERGY_IN from entry)
@@ -35,25 +36,31 @@ class EnergyEvent(Base):
 
     # ═══ Metadata ═══
     reference_id = Column(String(64), nullable=True)                 # Links to triggering event
-    extra_data = Column(JSON, default=dict)
+    extra_data = deferred(Column(JSONDocument, default=dict))              # Write-mostly — loaded on access
 
     # ═══ Timestamp ═══
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        # Time-windowed reads per type (7-day velocity) prune to the window
+        Index('ix_energy_events_type_created', 'event_type', 'created_at'),
+        # Newest-first field-wide energy map
+        Index('ix_energy_events_created', 'created_at'),
+    )
+
     def __repr__(self):
         return f"<Energy {self.event_type} | {self.amount_he} HE | {self.from_id}→{self.to_id}>"
 
-    def to_dict(self):
-        return {
-            "event_id": self.event_id,
-            "event_type": self.event_type,
-            "from_id": self.from_id,
-            "to_id": self.to_id,
-            "amount_he": self.amount_he,
-            "amount_usd": self.amount_usd,
-            "hop_number": self.hop_number,
-            "certificate_id": self.certificate_id,
-            "pool_name": self.pool_name,
-            "reference_id": self.reference_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+    _dict_fields = (
+        "event_id",
+        "event_type",
+        "from_id",
+        "to_id",
+        "amount_he",
+        "amount_usd",
+        "hop_number",
+        "certificate_id",
+        "pool_name",
+        "reference_id",
+        "created_at",
+    )
@@ -1,10 +1,96 @@
 """Member model — every node in the Helios neural field."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, Text, JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """
+    Declarative base. A model that lists `_dict_fields` gets a generated
+    to_dict: each entry is a column name, or a (key, attr) pair to emit
+    the attribute under another key. DateTime columns are serialized
+    with .isoformat(), None passing through.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "_dict_fields" in cls.__dict__:
+            cls.to_dict = _compile_to_dict(cls, cls._dict_fields)
+
+
+def _compile_to_dict(cls, fields):
+    """Build a straight-line to_dict: one attribute load per field, no loop."""
+    datetimes = {c.key for c in cls.__table__.columns if isinstance(c.type, DateTime)}
+    loads, items = [], []
+    for field in fields:
+        key, attr = (field, field) if isinstance(field, str) else field
+        if attr in datetimes:
+            loads.append(f"    {attr} = self.{attr}\n")
+            items.append(f"{key!r}: {attr}.isoformat() if {attr} is not None else None")
+        else:
+            items.append(f"{key!r}: self.{attr}")
+    source = "def to_dict(self):\n" + "".join(loads) + "    return {" + ", ".join(items) + "}\n"
+    namespace = {}
+    exec(compile(source, f"<{cls.__name__}.to_dict>", "exec"), namespace)
+    to_dict = namespace["to_dict"]
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    to_dict.__module__ = cls.__module__
+    return to_dict
+
+
+class utcnow(FunctionElement):
+    """Database-side UTC timestamp, rendered inline into the statement."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+# Ledger metadata documents — binary JSONB on PostgreSQL, plain JSON elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+
+class LedgerMixin:
+    """Append-only ledger tables — rows can be written in bulk as plain dicts."""
+
+    BULK_CHUNK = 10_000
+
+    @classmethod
+    def bulk_record(cls, session, rows: list, return_ids: bool = False):
+        """
+        Insert dict rows with one executemany per chunk, skipping ORM
+        instance state. Column defaults (created_at, extra_data, ...)
+        still apply. With return_ids, returns the new primary keys in
+        input order — that needs RETURNING, which SQLite can only order
+        one row per statement, so leave it off unless the ids are used.
+        """
+        from sqlalchemy import insert
+
+        if return_ids:
+            stmt = insert(cls).returning(cls.id, sort_by_parameter_order=True)
+        else:
+            stmt = insert(cls)
+        ids = []
+        for start in range(0, len(rows), cls.BULK_CHUNK):
+            chunk = rows[start:start + cls.BULK_CHUNK]
+            if return_ids:
+                ids.extend(session.scalars(stmt, chunk).all())
+            else:
+                session.execute(stmt, chunk)
+        return ids if return_ids else None
 
 
 class Member(Base):
@@ -27,22 +113,21 @@ class Member(Base):
     email_hash = Column(String(128), nullable=True)
     phone_verified = Column(Boolean, default=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, onupdate=utcnow())
 
     def __repr__(self):
         return f"<Node {self.helios_id} [{self.node_state}]>"
 
-    def to_dict(self):
-        return {
-            "helios_id": self.helios_id,
-            "display_name": self.display_name,
-            "initiator": self.referrer_id,
-            "node_state": self.node_state,
-            "bond_count": self.bond_count,
-            "status": self.status,
-            "verified": self.verified,
-            "member_since": self.created_at.isoformat() if self.created_at else None
-        }
+    _dict_fields = (
+        "helios_id",
+        "display_name",
+        ("initiator", "referrer_id"),
+        "node_state",
+        "bond_count",
+        "status",
+        "verified",
+        ("member_since", "created_at"),
+    )
 
     def update_node_state(self):
         """Recalculate node state based on bond count."""
@@ -53,3 +138,25 @@ class Member(Base):
         elif self.bond_count >= 1:
             self.node_state = "connected"
         # acknowledged and instantiated are set during join flow
+
+    @classmethod
+    def recompute_all_states(cls, session) -> int:
+        """
+        Table-wide update_node_state in one UPDATE … CASE. Rows with no
+        bonds, and rows already in the right state, are left untouched.
+        Returns the number of nodes whose state changed.
+        """
+        from sqlalchemy import case, update
+
+        state = case(
+            (cls.bond_count >= 5, "stable"),
+            (cls.bond_count >= 3, "propagating"),
+            else_="connected",
+        )
+        result = session.execute(
+            update(cls)
+            .where(cls.bond_count >= 1, cls.node_state != state)
+            .values(node_state=state)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,11 +1,13 @@
 """Reward model — every payout, fully auditable."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Integer, Float
-from models.member import Base
+from sqlalchemy import Column, String, DateTime, Integer, Float, Index
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship
+from models.member import Base, LedgerMixin
 
 
-class Reward(Base):
+class Reward(LedgerMixin, Base):
     __tablename__ = "rewards"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -18,5 +20,30 @@ class Reward(Base):
     status = Column(String(20), default="settled", index=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    # Node that triggered the settlement (view-only, keyed by helios_id)
+    source_member = relationship(
+        "Member",
+        primaryjoin="foreign(Reward.source_member_id) == Member.helios_id",
+        viewonly=True,
+    )
+
+    # Covers per-node history and settled totals: filter member_id/status, order by created_at, id
+    __table_args__ = (
+        Index('ix_rewards_member_status_created', 'member_id', 'status', 'created_at', 'id'),
+        # Settled totals split node vs pool, and the literal POOL account
+        Index('ix_rewards_status_member', 'status', 'member_id'),
+    )
+
+    # Derived from member_id rather than stored, so existing rewards tables
+    # (create_all never alters them) and old rows need no migration
+    @hybrid_property
+    def is_pool(self):
+        """Pool recipients are addressed as POOL:<name>."""
+        return self.member_id.startswith("POOL")
+
+    @is_pool.expression
+    def is_pool(cls):
+        return cls.member_id.startswith("POOL")
+
     def __repr__(self):
         return f"<Reward {self.member_id} | {self.amount} HLS>"
@@ -7,8 +7,8 @@ Space Key NFTs.
 """
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean, Text, JSON
-from models.member import Base
+from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean, Text, JSON, Index
+from models.member import Base, utcnow
 
 
 class Space(Base):
@@ -37,25 +37,29 @@ class Space(Base):
 
     # ═══ Timestamps ═══
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, onupdate=utcnow())
+
+    # Active listing, newest first (keyset on created_at)
+    __table_args__ = (
+        Index('ix_space_active_created', 'is_active', 'created_at', 'id'),
+    )
 
     def __repr__(self):
         return f"<Space {self.name} | {self.member_count} members>"
 
-    def to_dict(self):
-        return {
-            "space_id": self.space_id,
-            "name": self.name,
-            "description": self.description,
-            "owner_id": self.owner_id,
-            "is_public": self.is_public,
-            "max_members": self.max_members,
-            "room_count": self.room_count,
-            "entry_fee_usd": self.entry_fee_usd,
-            "member_count": self.member_count,
-            "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+    _dict_fields = (
+        "space_id",
+        "name",
+        "description",
+        "owner_id",
+        "is_public",
+        "max_members",
+        "room_count",
+        "entry_fee_usd",
+        "member_count",
+        "is_active",
+        "created_at",
+    )
 
 
 class SpaceEvent(Base):
@@ -87,21 +91,25 @@ class SpaceEvent(Base):
     # ═══ Timestamps ═══
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    # Active events per space, newest first (keyset on created_at)
+    __table_args__ = (
+        Index('ix_event_active_space_created', 'is_active', 'space_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<Event {self.title} | ${self.ticket_price_usd}>"
 
-    def to_dict(self):
-        return {
-            "event_id": self.event_id,
-            "space_id": self.space_id,
-            "host_id": self.host_id,
-            "title": self.title,
-            "description": self.description,
-            "event_type": self.event_type,
-            "ticket_price_usd": self.ticket_price_usd,
-            "max_attendees": self.max_attendees,
-            "attendee_count": self.attendee_count,
-            "starts_at": self.starts_at.isoformat() if self.starts_at else None,
-            "ends_at": self.ends_at.isoformat() if self.ends_at else None,
-            "is_active": self.is_active,
-        }
+    _dict_fields = (
+        "event_id",
+        "space_id",
+        "host_id",
+        "title",
+        "description",
+        "event_type",
+        "ticket_price_usd",
+        "max_attendees",
+        "attendee_count",
+        "starts_at",
+        "ends_at",
+        "is_active",
+    )
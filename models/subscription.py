@@ -9,6 +9,22 @@ from datetime import datetime, timezone
 from sqlalchemy import Column, String, DateTime, Integer, Float, Boolean
 from models.member import Base
 
+_BASE_FEATURES = ("network_access", "energy_flow", "ask_helios")
+
+# (flag bit, features it unlocks) — bits pack vault/space/credential/operator
+_FEATURE_FLAGS = (
+    (8, ("vault_dashboard", "metal_tracking", "certificate_minting")),
+    (4, ("space_entry", "event_hosting", "room_creation")),
+    (2, ("credential_application", "vendor_access")),
+    (1, ("operator_dashboard", "space_management", "metrics_access")),
+)
+
+# Every flag combination resolved once at import
+_FEATURES = tuple(
+    _BASE_FEATURES + tuple(f for bit, feats in _FEATURE_FLAGS if bits & bit for f in feats)
+    for bits in range(16)
+)
+
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
@@ -43,31 +59,23 @@ class Subscription(Base):
     def __repr__(self):
         return f"<Subscription {self.member_id} | {self.tier} [{'active' if self.is_active else 'inactive'}]>"
 
-    def to_dict(self):
-        return {
-            "subscription_id": self.subscription_id,
-            "member_id": self.member_id,
-            "tier": self.tier,
-            "monthly_fee_usd": self.monthly_fee_usd,
-            "is_active": self.is_active,
-            "vault_access": self.vault_access,
-            "space_access": self.space_access,
-            "credential_access": self.credential_access,
-            "operator_tools": self.operator_tools,
-            "months_active": self.months_active,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-        }
+    _dict_fields = (
+        "subscription_id",
+        "member_id",
+        "tier",
+        "monthly_fee_usd",
+        "is_active",
+        "vault_access",
+        "space_access",
+        "credential_access",
+        "operator_tools",
+        "months_active",
+        "started_at",
+    )
 
     @property
     def tier_features(self):
-        """Return features unlocked by current tier."""
-        features = ["network_access", "energy_flow", "ask_helios"]
-        if self.vault_access:
-            features.extend(["vault_dashboard", "metal_tracking", "certificate_minting"])
-        if self.space_access:
-            features.extend(["space_entry", "event_hosting", "room_creation"])
-        if self.credential_access:
-            features.extend(["credential_application", "vendor_access"])
-        if self.operator_tools:
-            features.extend(["operator_dashboard", "space_management", "metrics_access"])
-        return features
+        """Return features unlocked by current tier (shared, immutable tuple)."""
+        bits = (bool(self.vault_access) << 3 | bool(self.space_access) << 2
+                | bool(self.credential_access) << 1 | bool(self.operator_tools))
+        return _FEATURES[bits]
@@ -1,19 +1,26 @@
 """Transaction model — all network activity events."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Integer, Float, JSON
-from models.member import Base
+from sqlalchemy import Column, String, DateTime, Integer, Float, Index
+from sqlalchemy.orm import deferred
+from models.member import Base, JSONDocument, LedgerMixin
 
 
-class Transaction(Base):
+class Transaction(LedgerMixin, Base):
     __tablename__ = "transactions"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    member_id = Column(String(64), nullable=False, index=True)
+    member_id = Column(String(64), nullable=False)
     activity_type = Column(String(30), nullable=False, index=True)
     value = Column(Float, default=1.0)
-    extra_data = Column(JSON, default=dict)
+    # Write-mostly — loaded only when touched
+    extra_data = deferred(Column(JSONDocument, default=dict))
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    # Activity windows: one node's rows since a cutoff — a single range scan
+    __table_args__ = (
+        Index('ix_transactions_member_created', 'member_id', 'created_at'),
+    )
+
     def __repr__(self):
         return f"<Transaction {self.member_id} | {self.activity_type}>"
@@ -9,8 +9,8 @@ Custody States: IN_TREASURY → IN_VAULT → IN_TRANSIT → DELIVERED
 """
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Integer, Float, Text, JSON
-from models.member import Base
+from sqlalchemy import Column, String, DateTime, Integer, Float, Text, JSON, Index
+from models.member import Base, utcnow
 
 
 class VaultReceipt(Base):
@@ -28,7 +28,7 @@ class VaultReceipt(Base):
     purchase_date = Column(DateTime, nullable=False)
 
     # ═══ Metal Details ═══
-    metal = Column(String(20), nullable=False, default="GOLD")       # GOLD, SILVER, PLATINUM, PALLADIUM
+    metal = Column(String(20), nullable=False, default="GOLD", index=True)  # GOLD, SILVER, PLATINUM, PALLADIUM
     form = Column(String(40), nullable=False)                        # bar, coin, round
     purity = Column(String(10), nullable=False, default="0.9999")    # 4-nine fine
     weight_oz = Column(Float, nullable=False)
@@ -51,33 +51,37 @@ class VaultReceipt(Base):
 
     # ═══ Timestamps ═══
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, onupdate=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, onupdate=utcnow())
     delivered_at = Column(DateTime, nullable=True)
 
+    # Receipt listings page newest first on (created_at, id)
+    __table_args__ = (
+        Index('ix_vault_receipts_created_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<MVR {self.mvr_id} | {self.weight_oz}oz {self.metal} [{self.custody_status}]>"
 
-    def to_dict(self):
-        return {
-            "mvr_id": self.mvr_id,
-            "dealer": self.dealer,
-            "invoice_id": self.invoice_id,
-            "purchase_date": self.purchase_date.isoformat() if self.purchase_date else None,
-            "metal": self.metal,
-            "form": self.form,
-            "purity": self.purity,
-            "weight_oz": self.weight_oz,
-            "quantity": self.quantity,
-            "unit_cost_usd": self.unit_cost_usd,
-            "total_cost_usd": self.total_cost_usd,
-            "serials": self.serials,
-            "custody_status": self.custody_status,
-            "evidence_bundle_cid": self.evidence_bundle_cid,
-            "sha256_evidence_bundle": self.sha256_evidence_bundle,
-            "xrpl_tx_hash": self.xrpl_tx_hash,
-            "policy_version": self.policy_version,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-        }
+    _dict_fields = (
+        "mvr_id",
+        "dealer",
+        "invoice_id",
+        "purchase_date",
+        "metal",
+        "form",
+        "purity",
+        "weight_oz",
+        "quantity",
+        "unit_cost_usd",
+        "total_cost_usd",
+        "serials",
+        "custody_status",
+        "evidence_bundle_cid",
+        "sha256_evidence_bundle",
+        "xrpl_tx_hash",
+        "policy_version",
+        "created_at",
+    )
 
     @property
     def total_oz(self):
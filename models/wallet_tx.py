@@ -1,11 +1,11 @@
 """Wallet Transaction model — member-to-member transfers."""
 
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, DateTime, Integer, Float
-from models.member import Base
+from sqlalchemy import Column, String, DateTime, Integer, Float, Index
+from models.member import Base, LedgerMixin
 
 
-class WalletTransaction(Base):
+class WalletTransaction(LedgerMixin, Base):
     __tablename__ = "wallet_transactions"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -16,5 +16,15 @@ class WalletTransaction(Base):
     status = Column(String(20), default="completed", index=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
 
+    # Per-member history, newest first, from either side of the transfer
+    __table_args__ = (
+        # History pages on (created_at, id) per side
+        Index('ix_wallet_tx_from_created', 'from_id', 'created_at', 'id'),
+        Index('ix_wallet_tx_to_created', 'to_id', 'created_at', 'id'),
+        # Balance sums per side — amount trails so SUM is answered from the index
+        Index('ix_wtx_from_status', 'from_id', 'status', 'amount'),
+        Index('ix_wtx_to_status', 'to_id', 'status', 'amount'),
+    )
+
     def __repr__(self):
         return f"<WalletTx {self.from_id} → {self.to_id} | {self.amount}>"
@@ -0,0 +1,67 @@
+/**
+ * Helios Fortune Spin — render worker
+ * ═══════════════════════════════════════
+ * Owns the wheel canvas when the browser can hand it over
+ * (transferControlToOffscreen). Runs the spin animation off the
+ * main thread; the page keeps the odds, storage and the reveal.
+ *
+ *   page → {cmd:'init', canvas, face, cap, angle}
+ *   page → {cmd:'spin', from, by, duration}
+ *   worker → {ready:true} on load, {done:true} when a spin settles
+ */
+(function() {
+    var cx = 160, cy = 160;
+    var MIN_FRAME_MS = 14;
+    var ctx = null, face = null, cap = null, lastDraw = 0;
+
+    // Worker rAF is tied to the page's frames (and paused with it);
+    // older engines without it get a timer at roughly the same rate
+    var frame = self.requestAnimationFrame
+        ? function(cb) { self.requestAnimationFrame(cb); }
+        : function(cb) { setTimeout(function() { cb(performance.now()); }, 16); };
+
+    function drawWheel(rotation) {
+        ctx.clearRect(0, 0, 320, 320);
+        ctx.save();
+        ctx.translate(cx, cy);
+        ctx.rotate(rotation);
+        ctx.drawImage(face, -cx, -cy);
+        ctx.restore();
+        ctx.drawImage(cap, 0, 0);
+    }
+
+    function spin(from, by, duration) {
+        var startTime = null;
+        function animate(timestamp) {
+            if (!startTime) startTime = timestamp;
+            var progress = Math.min((timestamp - startTime) / duration, 1);
+            // Ease out cubic, multiplied out rather than through Math.pow
+            var inv = 1 - progress;
+            var eased = 1 - inv * inv * inv;
+            if (progress === 1 || timestamp - lastDraw >= MIN_FRAME_MS) {
+                drawWheel(from + by * eased);
+                lastDraw = timestamp;
+            }
+            if (progress < 1) {
+                frame(animate);
+            } else {
+                self.postMessage({done: true});
+            }
+        }
+        frame(animate);
+    }
+
+    self.onmessage = function(e) {
+        var msg = e.data;
+        if (msg.cmd === 'init') {
+            ctx = msg.canvas.getContext('2d');
+            face = msg.face;
+            cap = msg.cap;
+            drawWheel(msg.angle);
+        } else if (msg.cmd === 'spin') {
+            spin(msg.from, msg.by, msg.duration);
+        }
+    };
+
+    self.postMessage({ready: true});
+})();
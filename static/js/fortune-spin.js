@@ -0,0 +1,282 @@
+/**
+ * Helios Fortune Spin
+ * ═══════════════════════════════════════
+ * One spin per founding member. Weighted wheel on a canvas,
+ * prize table read from the #prize-data JSON block on the page.
+ */
+(function() {
+    // Prize table ships as a JSON data block: one JSON.parse, no object-literal compile
+    var prizes = JSON.parse(document.getElementById('prize-data').textContent);
+
+    var canvas = document.getElementById('fortune-wheel');
+    if (!canvas) return;
+    // The render worker ships next to this file
+    var workerUrl = document.currentScript
+        ? document.currentScript.src.replace(/[^\/]*$/, 'fortune-spin-worker.js') : null;
+    // Every element the engine touches, looked up once
+    var elBtn = document.getElementById('spin-btn'),
+        elStatus = document.getElementById('spin-status'),
+        elReveal = document.getElementById('prize-reveal'),
+        elIcon = document.getElementById('prize-icon'),
+        elTitle = document.getElementById('prize-title'),
+        elDesc = document.getElementById('prize-desc');
+    var cx = 160, cy = 160, r = 150;
+    var TWO_PI = 2 * Math.PI;
+    var sliceAngle = TWO_PI / prizes.length;
+    // Kept in [0, 2π): reduced after every spin so it never accumulates
+    var currentAngle = 0;
+    var spinning = false;
+    // Storage is read once at start-up; the locals are kept in step with every write
+    var played = sessionStorage.getItem('helios_spin_played');
+    var storedPrize = null;
+    try {
+        storedPrize = JSON.parse(localStorage.getItem('helios_spin_prize'));
+    } catch(e) {}
+    // Odds ship with the prize table. Walker/Vose alias table, built once:
+    // a spin picks a bucket, then keeps it or takes its alias — O(1) per draw
+    var n = prizes.length, totalWeight = 0;
+    for (var i = 0; i < n; i++) totalWeight += prizes[i].weight;
+    var aliasProb = new Float64Array(n), alias = new Uint8Array(n);
+    var scaled = [], small = [], large = [];
+    for (var i = 0; i < n; i++) {
+        scaled[i] = prizes[i].weight * n / totalWeight;
+        (scaled[i] < 1 ? small : large).push(i);
+    }
+    while (small.length && large.length) {
+        var sm = small.pop(), lg = large.pop();
+        aliasProb[sm] = scaled[sm];
+        alias[sm] = lg;
+        scaled[lg] = scaled[lg] + scaled[sm] - 1;
+        (scaled[lg] < 1 ? small : large).push(lg);
+    }
+    // Leftovers are 1 up to rounding
+    while (large.length) aliasProb[large.pop()] = 1;
+    while (small.length) aliasProb[small.pop()] = 1;
+
+    // Per-slice data: label lines, the slice colour with its 0.85 alpha baked
+    // in so the face is drawn without toggling globalAlpha, and the wheel
+    // angle that lands the slice centre under the pointer (top, -π/2)
+    for (var i = 0; i < n; i++) {
+        prizes[i].stopAngle = -Math.PI / 2 - (i + 0.5) * sliceAngle;
+        var rgb = parseInt(prizes[i].color.slice(1), 16);
+        prizes[i].fill = 'rgba(' + (rgb >> 16) + ',' + ((rgb >> 8) & 255) + ',' + (rgb & 255) + ',0.85)';
+        prizes[i].lines = prizes[i].label.split('\n');
+    }
+
+    // Where the browser can hand the canvas to a worker, the spin is animated
+    // there and the main thread stays free. The face and cap are then built
+    // on OffscreenCanvases so they can be passed over as bitmaps.
+    var canTransfer = !!(workerUrl && window.Worker && window.OffscreenCanvas &&
+        canvas.transferControlToOffscreen);
+
+    // The slices and labels only ever rotate, and the centre cap never moves,
+    // so both are rendered once; a frame is two drawImage calls
+    function offscreen() {
+        if (canTransfer) return new OffscreenCanvas(320, 320);
+        var c = document.createElement('canvas');
+        c.width = c.height = 320;
+        return c;
+    }
+
+    var face = offscreen();
+    (function(fctx) {
+        fctx.strokeStyle = 'rgba(0,0,0,0.3)';
+        fctx.lineWidth = 2;
+        fctx.font = 'bold 11px Inter, sans-serif';
+        fctx.textAlign = 'center';
+        for (var i = 0; i < n; i++) {
+            var startAngle = i * sliceAngle;
+            var endAngle = startAngle + sliceAngle;
+
+            // Slice
+            fctx.beginPath();
+            fctx.moveTo(cx, cy);
+            fctx.arc(cx, cy, r, startAngle, endAngle);
+            fctx.closePath();
+            fctx.fillStyle = prizes[i].fill;
+            fctx.fill();
+            fctx.stroke();
+
+            // Label
+            fctx.save();
+            fctx.translate(cx, cy);
+            fctx.rotate(startAngle + sliceAngle / 2);
+            fctx.fillStyle = '#fff';
+            var lines = prizes[i].lines;
+            for (var l = 0; l < lines.length; l++) {
+                fctx.fillText(lines[l], r * 0.62, 4 + (l - (lines.length-1)/2) * 14);
+            }
+            fctx.restore();
+        }
+    })(face.getContext('2d'));
+
+    var cap = offscreen();
+    (function(cctx) {
+        // Canvas can't read CSS variables, so resolve --gold here
+        var gold = getComputedStyle(document.documentElement).getPropertyValue('--gold').trim() || '#fbbf24';
+        cctx.beginPath();
+        cctx.arc(cx, cy, 28, 0, TWO_PI);
+        cctx.fillStyle = '#0a0a0c';
+        cctx.fill();
+        cctx.strokeStyle = gold;
+        cctx.lineWidth = 2;
+        cctx.stroke();
+        cctx.fillStyle = '#fbbf24';
+        cctx.font = 'bold 16px Inter, sans-serif';
+        cctx.textAlign = 'center';
+        cctx.textBaseline = 'middle';
+        cctx.fillText('☀️', cx, cy);
+    })(cap.getContext('2d'));
+
+    function drawWheel(rotation) {
+        ctx.clearRect(0, 0, 320, 320);
+        ctx.save();
+        ctx.translate(cx, cy);
+        ctx.rotate(rotation);
+        ctx.drawImage(face, -cx, -cy);
+        ctx.restore();
+        ctx.drawImage(cap, 0, 0);
+    }
+
+    // Renderer: either `ctx` (main thread) or `worker` once it has the canvas.
+    // A canvas with a context can no longer be transferred, so the main-thread
+    // context is only taken if the worker doesn't come up.
+    var ctx = null, worker = null;
+
+    function renderOnMainThread() {
+        worker = null;
+        ctx = canvas.getContext('2d');
+        drawWheel(currentAngle);
+    }
+
+    if (canTransfer) {
+        var pending = new Worker(workerUrl);
+        pending.onerror = function() {
+            if (!worker) renderOnMainThread();
+        };
+        pending.onmessage = function(e) {
+            if (e.data.ready) {
+                var view = canvas.transferControlToOffscreen();
+                var faceBmp = face.transferToImageBitmap(), capBmp = cap.transferToImageBitmap();
+                pending.postMessage({cmd: 'init', canvas: view, face: faceBmp, cap: capBmp, angle: currentAngle},
+                    [view, faceBmp, capBmp]);
+                worker = pending;
+            } else if (e.data.done) {
+                settle();
+            }
+        };
+    } else {
+        renderOnMainThread();
+    }
+
+    // One rAF pump: the pending frame's id is kept so it can be cancelled while
+    // the tab is hidden and picked up again (time-based, so it catches up) when
+    // the tab returns. Draws are capped near 60fps on high-refresh displays.
+    var MIN_FRAME_MS = 14;
+    var rafId = null, pendingFrame = null, lastDraw = 0;
+
+    function schedule(frame) {
+        pendingFrame = frame;
+        rafId = requestAnimationFrame(frame);
+    }
+
+    document.addEventListener('visibilitychange', function() {
+        if (document.hidden) {
+            if (rafId !== null) {
+                cancelAnimationFrame(rafId);
+                rafId = null;
+            }
+        } else if (pendingFrame && rafId === null) {
+            rafId = requestAnimationFrame(pendingFrame);
+        }
+    });
+
+    // Set when a spin starts; settle() finishes it from either renderer
+    var settle = null;
+
+    window.spinWheel = function() {
+        if (spinning || !(ctx || worker)) return;
+        if (played) {
+            elStatus.textContent = 'You already claimed your spin! Activate to lock in your bonus.';
+            return;
+        }
+
+        spinning = true;
+        elBtn.style.opacity = '0.5';
+        elBtn.textContent = 'Spinning...';
+        elStatus.textContent = '';
+        elReveal.style.display = 'none';
+
+        // Weighted: slight bias toward good-but-not-best prizes
+        var bucket = (Math.random() * n) | 0;
+        var winIndex = Math.random() < aliasProb[bucket] ? bucket : alias[bucket];
+
+        // Add 5-8 full rotations for drama, then land on the winner's stop angle
+        var spins = 5 + Math.floor(Math.random() * 3);
+        var totalRotation = spins * TWO_PI + (prizes[winIndex].stopAngle - currentAngle);
+
+        var startTime = null;
+        var duration = 4000 + Math.random() * 1000;
+        var startAngle = currentAngle;
+
+        settle = function() {
+            settle = null;
+            currentAngle = ((startAngle + totalRotation) % TWO_PI + TWO_PI) % TWO_PI;
+            spinning = false;
+            elBtn.style.opacity = '1';
+            elBtn.textContent = '🎰 SPIN TO WIN';
+            played = '1';
+            sessionStorage.setItem('helios_spin_played', played);
+            showPrize(prizes[winIndex]);
+        };
+
+        if (worker) {
+            worker.postMessage({cmd: 'spin', from: startAngle, by: totalRotation, duration: duration});
+            return;
+        }
+
+        function animate(timestamp) {
+            rafId = null;
+            if (!startTime) startTime = timestamp;
+            var elapsed = timestamp - startTime;
+            var progress = Math.min(elapsed / duration, 1);
+            // Ease out cubic, multiplied out rather than through Math.pow
+            var inv = 1 - progress;
+            var eased = 1 - inv * inv * inv;
+            currentAngle = startAngle + totalRotation * eased;
+            if (progress === 1 || timestamp - lastDraw >= MIN_FRAME_MS) {
+                drawWheel(currentAngle);
+                lastDraw = timestamp;
+            }
+
+            if (progress < 1) {
+                schedule(animate);
+            } else {
+                pendingFrame = null;
+                settle();
+            }
+        }
+        schedule(animate);
+    };
+
+    function showPrize(prize) {
+        elIcon.textContent = prize.icon;
+        elTitle.textContent = prize.title;
+        elDesc.textContent = prize.desc;
+        elReveal.style.display = 'block';
+        elStatus.innerHTML = '<strong style="color:var(--gold);">Bonus unlocked!</strong> Activate your contract to claim it.';
+
+        // Store the prize for the activation flow
+        storedPrize = {
+            title: prize.title,
+            icon: prize.icon,
+            ts: Date.now()
+        };
+        localStorage.setItem('helios_spin_prize', JSON.stringify(storedPrize));
+    }
+
+    // If already spun, show the result
+    if (storedPrize && played) {
+        elStatus.innerHTML = 'You won: <strong style="color:var(--gold);">' + storedPrize.title + '</strong> — Activate to claim!';
+    }
+})();
@@ -76,7 +76,7 @@
             return { success: true, data: { display: '247.50 HLS', balance: 247.5, earned: 247.5, sent: 12.0, received: 35.0 } };
 
         if (url.match(/\/api\/wallet\/history\//))
-            return { success: true, data: [
+            return { success: true, data: { items: [
                 { type: 'received', display: 'Energy propagation from alpha.helios — hop 1', date: '2026-02-09T14:30:00Z' },
                 { type: 'received', display: 'Energy propagation from sierra.helios — hop 2', date: '2026-02-08T09:15:00Z' },
                 { type: 'earned', display: 'Settlement reward — 4.25 HLS', date: '2026-02-07T18:00:00Z' },
@@ -84,7 +84,7 @@
                 { type: 'received', display: 'Energy propagation from echo.helios — hop 1', date: '2026-02-05T16:45:00Z' },
                 { type: 'earned', display: 'Settlement reward — 3.80 HLS', date: '2026-02-04T18:00:00Z' },
                 { type: 'received', display: 'Certificate redemption — 50.00 HE', date: '2026-02-03T10:00:00Z' }
-            ]};
+            ], next_cursor: null }};
 
         if (url === '/api/wallet/send')
             return { success: true, data: { message: 'Demo mode — live transfers require the running protocol.' } };
@@ -1,13 +1,28 @@
 """Quick contract + metrics verification for launch."""
+from concurrent.futures import ThreadPoolExecutor
 from app import create_app
-import json
 
 app = create_app()
 client = app.test_client()
 
+API_PATHS = ['/api/token/info', '/api/token/verify', '/api/token/founder-lock', '/api/token/supply',
+             '/api/treasury/reserves', '/api/certificates/covenant', '/api/certificates/active',
+             '/api/energy/conservation', '/api/metrics/all', '/api/metrics/health',
+             '/api/rewards/protocol', '/api/field/status', '/api/infra/status']
+pages = ['/', '/dashboard', '/field', '/network', '/ask', '/protocol', '/status',
+         '/treasury', '/vault', '/vault/gold', '/activate', '/metrics', '/enter', '/join', '/health']
+
+def fetch(path):
+    return path, client.get(path)
+
+# Fan the GETs out across threads (each gets its own scoped DB session),
+# then report serially below in a fixed order
+with ThreadPoolExecutor(max_workers=8) as pool:
+    responses = dict(pool.map(fetch, API_PATHS + pages))
+
 def api(path):
     """Get JSON, unwrap {success, data} envelope if present."""
-    raw = json.loads(client.get(path).data)
+    raw = responses[path].get_json()
     if isinstance(raw, dict) and 'data' in raw:
         return raw['data']
     return raw
@@ -24,60 +39,60 @@ v = api('/api/token/verify')
 print(f"Verify: supply_correct={v.get('supply_correct', v.get('valid'))}  no_mint={v.get('no_mint_function', 'n/a')}")
 
 fl = api('/api/token/founder-lock')
-print(f"Founder Lock: locked={fl['locked']}  amount={fl.get('amount',0):,}  unlock={fl.get('unlock_date','n/a')}")
+print(f"Founder Lock: locked={fl['founder_tokens_locked']}  years={fl.get('lock_years','n/a')}  unlock={fl.get('lock_ends','n/a')}")
 
 s = api('/api/token/supply')
 print(f"Supply: total={s['total_supply']:,.0f}  circulating={s.get('circulating',0):,}  minted={s.get('minted','n/a')}")
 
 print("\n=== TREASURY / METAL RESERVES ===")
-res = json.loads(client.get('/api/treasury/reserves').data)
-print(f"Receipts: {res['total_receipts']}  Anchored: {res['anchored_count']}")
+res = api('/api/treasury/reserves')
+print(f"Receipts: {res['total_receipts']}  Anchored: {res['anchored_on_xrpl']}")
 for metal, data in res.get('by_metal', {}).items():
     print(f"  {metal}: {data['total_oz']} oz  ${data['total_cost_usd']:,.2f}  ({data['receipt_count']} receipts)")
 
 print("\n=== CERTIFICATES ===")
-cov = json.loads(client.get('/api/certificates/covenant').data)
-d = cov.get('data', cov)
+d = api('/api/certificates/covenant')
 print(f"Covenant: status={d.get('status')}  ratio={d.get('ratio')}  redemption_ok={d.get('redemption_permitted')}")
 
-act = json.loads(client.get('/api/certificates/active').data)
+act = api('/api/certificates/active')
 print(f"Active: {act}")
 
 print("\n=== ENERGY CONSERVATION LAW ===")
-con = json.loads(client.get('/api/energy/conservation').data)
+con = api('/api/energy/conservation')
 print(f"Balanced: {con['balanced']}")
 print(f"  In: {con['total_in']}  Routed: {con['total_routed']}  Stored: {con['total_stored']}  Pooled: {con['total_pooled']}  Burned: {con['total_burned']}")
-print(f"  Delta: {con['delta']} (should be 0)")
+print(f"  Balance: {con['balance']} (should be 0)")
 
 print("\n=== METRICS FORMULAS ===")
-m = json.loads(client.get('/api/metrics/all').data)
+m = api('/api/metrics/all')
 for name, val in m.items():
-    print(f"  {name}: value={val['value']}  status={val['status']}")
+    if not isinstance(val, dict):
+        continue
+    print(f"  {name}: formula={val.get('formula')}  status={val.get('status', 'n/a')}")
 
-h = json.loads(client.get('/api/metrics/health').data)
-print(f"  Network: nodes={h['total_nodes']}  active={h['active_nodes']}  certs={h['active_certificates']}  energy={h['total_energy_he']} HE")
+h = api('/api/metrics/health')
+print(f"  Network: nodes={h['total_nodes']}  active={h['active_nodes']}  certs={h['certificates']['active']}  energy={h['total_energy_injected_he']} HE")
 
 print("\n=== REWARDS / SETTLEMENT ===")
-rp = json.loads(client.get('/api/rewards/protocol').data)
-print(f"Settlement: {rp['settlement_rules']}  max_hops={rp['max_hops']}  decay={rp['decay']}")
+rp = api('/api/rewards/protocol')
+print(f"Settlement: min_activity={rp['settlement_min_activity']}  max_hops={rp['propagation_max_hops']}  decay={rp['propagation_decay_base']}")
 
 print("\n=== FIELD STATUS ===")
-fs = json.loads(client.get('/api/field/status').data)
+fs = api('/api/field/status')
 print(f"Field: {fs}")
 
 print("\n=== INFRASTRUCTURE ===")
-inf = json.loads(client.get('/api/infra/status').data)
-d2 = inf.get('data', inf)
+d2 = api('/api/infra/status')
 print(f"Status: {d2.get('status')}")
 for svc, st in d2.get('services', {}).items():
     print(f"  {svc}: {st}")
 
 print("\n=== ALL PAGES ===")
-pages = ['/', '/dashboard', '/field', '/network', '/ask', '/protocol', '/status',
-         '/treasury', '/vault', '/vault/gold', '/activate', '/metrics', '/enter', '/join', '/health']
 for p in pages:
-    r = client.get(p)
-    size = len(r.data)
+    r = responses[p]
+    # Rendered pages carry Content-Length; otherwise count the body chunks
+    # rather than joining them into one bytes object
+    size = r.content_length or sum(len(chunk) for chunk in r.iter_encoded())
     status = "OK" if r.status_code == 200 else f"FAIL({r.status_code})"
     print(f"  {p:20s} {size:>6d}B  {status}")
 
@@ -4,7 +4,10 @@
 Use this with a production WSGI server:
 
   waitress-serve --host=0.0.0.0 --port=5050 wsgi:application
-  gunicorn -w 4 -b 0.0.0.0:5050 wsgi:application
+  gunicorn wsgi:application
+
+gunicorn picks up gunicorn.conf.py from the working directory: the app is
+preloaded once and forked into gthread workers.
 
 Never use `python app.py` in production.
 """